@@ -16,23 +16,23 @@ from .full_binary_tree import FullBinaryTree
 from .avl_tree import AVLTree, Node as AVLNode
 from .red_black_tree import RedBlackTree, Node as RBNode
 from .b_tree import BTree, Node as BTNode
-from .trie import Trie, TrieNode
-from .hash_table import HashTable, HashNode
+from .trie import Trie, RadixTrie, TernarySearchTree, DAFSA, TrieNode, TSTNode
+from .hash_table import HashTable, StringHashTable, HashNode
 from .graph import Graph, Vertex
 
 # Queue-like data structures
 from .queue import Queue
 from .deque import Deque
-from .priority_queue import PriorityQueue
+from .priority_queue import PriorityQueue, DaryPriorityQueue, BucketPriorityQueue
 from .monotonic_queue import MonotonicQueue
 
 # Stack-like data structures
-from .stack import Stack
+from .stack import Stack, IntStack
 from .monotonic_stack import MonotonicStack
 
 # Heap data structures
-from .min_heap import MinHeap
-from .max_heap import MaxHeap
+from .min_heap import MinHeap, IntMinHeap
+from .max_heap import MaxHeap, IntMaxHeap
 
 # Advanced data structures
 from .bloom_filter import BloomFilter
@@ -41,7 +41,7 @@ from .sparse_table import SparseTable
 from .disjoint_set import DisjointSet
 from .fenwick_tree import FenwickTree
 
-from .segment_tree import SegmentTree
+from .segment_tree import SegmentTree, IntSegmentTree, LazySegmentTree
 
 from .skip_list import SkipList
 
@@ -62,30 +62,30 @@ __all__ = [
     'AVLTree', 'AVLNode',
     'RedBlackTree', 'RBNode',
     'BTree', 'BTNode',
-    'Trie', 'TrieNode',
-    'HashTable', 'HashNode',
+    'Trie', 'RadixTrie', 'TernarySearchTree', 'DAFSA', 'TrieNode', 'TSTNode',
+    'HashTable', 'StringHashTable', 'HashNode',
     'Graph', 'Vertex',
     
     # Queue-like data structures
     'Queue',
     'Deque',
-    'PriorityQueue',
+    'PriorityQueue', 'DaryPriorityQueue', 'BucketPriorityQueue',
     'MonotonicQueue',
     
     # Stack-like data structures
-    'Stack',
+    'Stack', 'IntStack',
     'MonotonicStack',
     
     # Heap data structures
-    'MinHeap',
-    'MaxHeap',
+    'MinHeap', 'IntMinHeap',
+    'MaxHeap', 'IntMaxHeap',
     
     # Advanced data structures
     'BloomFilter',
     'SparseTable',
     'DisjointSet',
     'FenwickTree',
-    'SegmentTree',
+    'SegmentTree', 'IntSegmentTree', 'LazySegmentTree',
     'SkipList',
     'SuffixTree', 'SuffixTreeNode',
     'Rope', 'RopeNode',
@@ -1,5 +1,6 @@
+import sys
 import unittest
-from typing import Any, List, Optional, Tuple
+from typing import Any, Iterable, List, Optional, Tuple
 from collections import deque
 
 class HashNode:
@@ -11,6 +12,8 @@ class HashNode:
         value: The value associated with the key
         is_deleted: Whether this node has been deleted
     """
+    __slots__ = ("key", "value", "is_deleted")
+    
     def __init__(self, key: Any, value: Any):
         """
         Initialize a Hash Table node.
@@ -29,28 +32,46 @@ class HashTable:
     a structure that can map keys to values. It uses a hash function to compute an index into
     an array of buckets or slots, from which the desired value can be found.
     
-    This implementation uses open addressing with linear probing for collision resolution.
+    This implementation uses open addressing with triangular (quadratic) probing for
+    collision resolution. The capacity is always a power of two, which guarantees the
+    probe sequence visits every slot exactly once.
     
     Methods:
         - insert(key, value) add a key-value pair
+        - insert_many(pairs) add many key-value pairs at once
         - delete(key) remove a key-value pair
         - get(key) get the value associated with a key
+        - get_with_hash(key, known_hash) get a value using a precomputed hash
         - contains(key) check if a key exists
         - clear() remove all key-value pairs
         - size() get the number of key-value pairs
     """
-    def __init__(self, initial_size: int = 16, load_factor: float = 0.75):
+    def __init__(self, initial_size: int = 16, load_factor: float = 0.75, shrink_factor: float = 0.2,
+                 key_type: Optional[type] = None):
         """
         Initialize an empty Hash Table.
         
         Args:
-            initial_size: The initial size of the hash table (default: 16)
+            initial_size: The initial size of the hash table, rounded up to a power of two (default: 16)
             load_factor: The maximum load factor before resizing (default: 0.75)
+            shrink_factor: The load factor below which the table shrinks on delete (default: 0.2)
+            key_type: int or str if every key has that type, to use a specialized
+                      hash function without runtime type checks (default: None)
+                      
+        Raises:
+            ValueError: if key_type is not None, int or str
         """
+        if key_type not in (None, int, str):
+            raise ValueError(f"Unsupported key type: {key_type!r}")
         self.size = 0
-        self.capacity = initial_size
+        self.initial_size = 1 << max(initial_size - 1, 0).bit_length()
+        self.capacity = self.initial_size
         self.load_factor = load_factor
-        self.table: List[Optional[HashNode]] = [None] * initial_size
+        self.shrink_factor = shrink_factor
+        self.deleted = 0
+        self.key_type = key_type
+        self.table: List[Optional[HashNode]] = [None] * self.capacity
+        self._specialize_hash()
         
     def __str__(self) -> str:
         """
@@ -78,39 +99,69 @@ class HashTable:
             return key % self.capacity
         return hash(key) % self.capacity
         
+    def _specialize_hash(self) -> None:
+        """
+        Generate a _hash for the configured key type with the current capacity mask baked in.
+        
+        The generated function skips the isinstance check and the modulo of the generic
+        _hash. It must be regenerated whenever the capacity changes. Subclasses that
+        override _hash keep their own hash and are not specialized.
+        """
+        if self.key_type is None or type(self)._hash is not HashTable._hash:
+            return
+        mask = self.capacity - 1
+        if self.key_type is int:
+            source = f"def _hash(self, key):\n    return key & {mask}\n"
+        else:
+            source = f"def _hash(self, key):\n    return hash(key) & {mask}\n"
+        namespace: dict = {}
+        exec(source, namespace)
+        self._hash = namespace["_hash"].__get__(self)
+        
     def _probe(self, key: Any, start_index: int) -> int:
         """
-        Find the next available slot using linear probing.
+        Find the slot holding a key, or the next available slot, using triangular probing.
+        
+        The i-th probe lands on start_index + i * (i + 1) / 2, which breaks up the
+        primary clusters linear probing builds at high load factors.
         
         Args:
             key: The key to find a slot for
             start_index: The initial index to start probing from
             
         Returns:
-            The index of the next available slot
+            The index of the key or of the next available slot, or -1 if the table is full
         """
+        table = self.table
+        mask = self.capacity - 1
         index = start_index
         first_deleted = -1
         
-        while True:
-            if self.table[index] is None:
+        for step in range(1, self.capacity + 1):
+            node = table[index]
+            if node is None:
                 return first_deleted if first_deleted != -1 else index
-            if self.table[index].is_deleted and first_deleted == -1:
-                first_deleted = index
-            if not self.table[index].is_deleted and self.table[index].key == key:
+            if node.is_deleted:
+                if first_deleted == -1:
+                    first_deleted = index
+            elif node.key == key:
                 return index
-            index = (index + 1) % self.capacity
-            if index == start_index:
-                return -1  # Table is full
+            index = (index + step) & mask
+        return first_deleted  # -1 if the table is full
                 
-    def _resize(self) -> None:
+    def _resize(self, new_capacity: Optional[int] = None) -> None:
         """
-        Resize the hash table when the load factor is exceeded.
+        Resize the hash table and rehash every live entry.
+        
+        Args:
+            new_capacity: The capacity to resize to (default: double the current capacity)
         """
         old_table = self.table
-        self.capacity *= 2
+        self.capacity = new_capacity if new_capacity is not None else self.capacity * 2
         self.table = [None] * self.capacity
+        self._specialize_hash()
         self.size = 0
+        self.deleted = 0
         
         for node in old_table:
             if node is not None and not node.is_deleted:
@@ -126,16 +177,48 @@ class HashTable:
         """
         if self.size / self.capacity >= self.load_factor:
             self._resize()
+        self._place(key, value)
+        
+    def insert_many(self, pairs: Iterable[Tuple[Any, Any]]) -> None:
+        """
+        Insert many key-value pairs, growing the table at most once up front.
+        
+        Args:
+            pairs: An iterable of (key, value) tuples
+        """
+        pairs = list(pairs)
+        capacity = self.capacity
+        while (self.size + len(pairs)) / capacity >= self.load_factor:
+            capacity *= 2
+        if capacity != self.capacity:
+            self._resize(capacity)
+            
+        place = self._place
+        for key, value in pairs:
+            place(key, value)
             
+    def _place(self, key: Any, value: Any) -> None:
+        """
+        Store a key-value pair without checking the load factor.
+        
+        Args:
+            key: The key to insert
+            value: The value to associate with the key
+        """
         index = self._probe(key, self._hash(key))
         if index == -1:
             raise RuntimeError("Hash table is full")
             
-        if self.table[index] is None or self.table[index].is_deleted:
+        node = self.table[index]
+        if node is None:
             self.table[index] = HashNode(key, value)
             self.size += 1
+        elif node.is_deleted:
+            self.table[index] = HashNode(key, value)
+            self.size += 1
+            self.deleted -= 1
         else:
-            self.table[index].value = value
+            node.value = value
             
     def get(self, key: Any) -> Optional[Any]:
         """
@@ -148,9 +231,32 @@ class HashTable:
             The value associated with the key, or None if not found
         """
         index = self._probe(key, self._hash(key))
-        if index == -1 or self.table[index] is None or self.table[index].is_deleted:
+        if index == -1:
             return None
-        return self.table[index].value
+        node = self.table[index]
+        if node is None or node.is_deleted:
+            return None
+        return node.value
+        
+    def get_with_hash(self, key: Any, known_hash: int) -> Optional[Any]:
+        """
+        Get the value associated with a key whose hash the caller has already computed.
+        
+        Args:
+            key: The key to look up
+            known_hash: The full hash of the key, which is the key itself for int keys
+                        and hash(key) for any other key
+            
+        Returns:
+            The value associated with the key, or None if not found
+        """
+        index = self._probe(key, known_hash & (self.capacity - 1))
+        if index == -1:
+            return None
+        node = self.table[index]
+        if node is None or node.is_deleted:
+            return None
+        return node.value
         
     def delete(self, key: Any) -> bool:
         """
@@ -163,13 +269,32 @@ class HashTable:
             True if the key was deleted, False if it wasn't found
         """
         index = self._probe(key, self._hash(key))
-        if index == -1 or self.table[index] is None or self.table[index].is_deleted:
+        if index == -1:
+            return False
+        node = self.table[index]
+        if node is None or node.is_deleted:
             return False
             
-        self.table[index].is_deleted = True
+        node.is_deleted = True
         self.size -= 1
+        self.deleted += 1
+        
+        # Shrink the table once it is mostly empty so churning workloads don't
+        # keep paying for a table sized for their peak
+        if self.capacity > self.initial_size and self.size / self.capacity < self.shrink_factor:
+            self._resize(max(self.initial_size, self.capacity // 2))
+        # Otherwise purge tombstones once they make up a quarter of the table,
+        # since every probe sequence has to skip over them
+        elif self.deleted > self.capacity // 4:
+            self._rehash_in_place()
         return True
         
+    def _rehash_in_place(self) -> None:
+        """
+        Rebuild the table at the same capacity, dropping all deleted nodes.
+        """
+        self._resize(self.capacity)
+        
     def contains(self, key: Any) -> bool:
         """
         Check if a key exists in the hash table.
@@ -188,6 +313,7 @@ class HashTable:
         """
         self.table = [None] * self.capacity
         self.size = 0
+        self.deleted = 0
         
     def keys(self) -> List[Any]:
         """
@@ -217,6 +343,66 @@ class HashTable:
         return [(node.key, node.value) for node in self.table if node is not None and not node.is_deleted]
 
 
+class StringHashTable(HashTable):
+    """
+    A Hash Table specialized for short string keys.
+    
+    Strings of up to SHORT_KEY_LENGTH characters are hashed with a cheap
+    polynomial hash instead of the built-in siphash, and string keys are
+    interned on insert so probe comparisons against interned lookups reduce
+    to an identity check. The short-key hash has weaker collision resistance,
+    so this table should not be used with adversarial keys.
+    """
+    SHORT_KEY_LENGTH = 8
+    
+    def _hash(self, key: Any) -> int:
+        """
+        Compute the hash value for a key, using a polynomial hash for short strings.
+        
+        Args:
+            key: The key to hash
+            
+        Returns:
+            The hash value
+        """
+        if isinstance(key, str) and len(key) <= self.SHORT_KEY_LENGTH:
+            h = 0
+            for char in key:
+                h = (h * 31 + ord(char)) & 0xFFFFFFFF
+            return h % self.capacity
+        return super()._hash(key)
+        
+    def get_with_hash(self, key: Any, known_hash: int) -> Optional[Any]:
+        """
+        Get the value associated with a key whose hash the caller has already computed.
+        
+        Short string keys are placed by the polynomial hash rather than hash(key),
+        so known_hash is ignored for them and the slot is recomputed.
+        
+        Args:
+            key: The key to look up
+            known_hash: The full hash of the key, as for HashTable.get_with_hash
+            
+        Returns:
+            The value associated with the key, or None if not found
+        """
+        if isinstance(key, str) and len(key) <= self.SHORT_KEY_LENGTH:
+            return self.get(key)
+        return super().get_with_hash(key, known_hash)
+        
+    def _place(self, key: Any, value: Any) -> None:
+        """
+        Store a key-value pair without checking the load factor, interning string keys.
+        
+        Args:
+            key: The key to insert
+            value: The value to associate with the key
+        """
+        if type(key) is str:
+            key = sys.intern(key)
+        super()._place(key, value)
+
+
 class TestHashTable(unittest.TestCase):
     def setUp(self):
         self.table = HashTable()
@@ -281,6 +467,90 @@ class TestHashTable(unittest.TestCase):
         for i in range(13):
             self.assertEqual(self.table.get(f"key{i}"), f"value{i}")
             
+    def test_shrink(self):
+        for i in range(100):
+            self.table.insert(i, i)
+        grown_capacity = self.table.capacity
+        self.assertGreater(grown_capacity, 16)
+        
+        for i in range(95):
+            self.assertTrue(self.table.delete(i))
+            
+        self.assertLess(self.table.capacity, grown_capacity)
+        self.assertGreaterEqual(self.table.capacity, 16)
+        self.assertEqual(self.table.size, 5)
+        for i in range(95, 100):
+            self.assertEqual(self.table.get(i), i)
+            
+        # Never shrinks below the initial size
+        for i in range(95, 100):
+            self.table.delete(i)
+        self.assertEqual(self.table.capacity, 16)
+        
+    def test_insert_many(self):
+        self.table.insert("key0", "old")
+        self.table.insert_many((f"key{i}", f"value{i}") for i in range(100))
+        
+        self.assertEqual(self.table.size, 100)
+        self.assertEqual(self.table.capacity, 256)
+        for i in range(100):
+            self.assertEqual(self.table.get(f"key{i}"), f"value{i}")
+            
+        # Growing up front keeps the table under the load factor
+        self.assertLess(self.table.size / self.table.capacity, self.table.load_factor)
+        
+    def test_tombstones_purged(self):
+        table = HashTable(initial_size=64)
+        for i in range(40):
+            table.insert(i, i)
+            
+        # Delete-and-reinsert churn at a steady size
+        for i in range(40, 200):
+            table.delete(i - 40)
+            table.insert(i, i)
+            self.assertLessEqual(table.deleted, table.capacity // 4)
+            
+        self.assertEqual(table.capacity, 64)
+        self.assertEqual(table.size, 40)
+        for i in range(160, 200):
+            self.assertEqual(table.get(i), i)
+            
+    def test_power_of_two_capacity(self):
+        table = HashTable(initial_size=10)
+        self.assertEqual(table.capacity, 16)
+        
+        # Every slot is reachable from a single home index
+        for i in range(12):
+            table.insert(i * 16, i)
+        for i in range(12):
+            self.assertEqual(table.get(i * 16), i)
+            
+    def test_key_type_specialization(self):
+        table = HashTable(key_type=int)
+        for i in range(-50, 50):
+            table.insert(i, i * 2)
+        self.assertGreater(table.capacity, 16)
+        for i in range(-50, 50):
+            self.assertEqual(table.get(i), i * 2)
+        self.assertTrue(table.delete(-1))
+        self.assertIsNone(table.get(-1))
+        
+        table = HashTable(key_type=str)
+        for i in range(50):
+            table.insert(f"key{i}", i)
+        for i in range(50):
+            self.assertEqual(table.get(f"key{i}"), i)
+            
+        with self.assertRaises(ValueError):
+            HashTable(key_type=float)
+            
+    def test_get_with_hash(self):
+        self.table.insert("key1", "value1")
+        self.table.insert(-1, "minus one")
+        self.assertEqual(self.table.get_with_hash("key1", hash("key1")), "value1")
+        self.assertEqual(self.table.get_with_hash(-1, -1), "minus one")
+        self.assertIsNone(self.table.get_with_hash("missing", hash("missing")))
+        
     def test_collision_handling(self):
         # Force collisions by using same hash
         self.table.insert(0, "value0")
@@ -320,4 +590,52 @@ class TestHashTable(unittest.TestCase):
         self.assertEqual(self.table.get(True), "bool")
         self.assertEqual(self.table.get(None), "none")
 
- 
\ No newline at end of file
+ 
+
+
+class TestStringHashTable(unittest.TestCase):
+    def setUp(self):
+        self.table = StringHashTable()
+        
+    def test_short_and_long_keys(self):
+        self.table.insert("a", 1)
+        self.table.insert("abcdefgh", 2)
+        self.table.insert("a much longer key", 3)
+        self.table.insert(42, 4)
+        
+        self.assertEqual(self.table.get("a"), 1)
+        self.assertEqual(self.table.get("abcdefgh"), 2)
+        self.assertEqual(self.table.get("a much longer key"), 3)
+        self.assertEqual(self.table.get(42), 4)
+        self.assertIsNone(self.table.get("b"))
+        
+    def test_resize_and_delete(self):
+        for i in range(200):
+            self.table.insert(f"k{i}", i)
+        self.assertEqual(self.table.size, 200)
+        for i in range(200):
+            self.assertEqual(self.table.get(f"k{i}"), i)
+            
+        for i in range(0, 200, 2):
+            self.assertTrue(self.table.delete(f"k{i}"))
+        for i in range(200):
+            self.assertEqual(self.table.get(f"k{i}"), None if i % 2 == 0 else i)
+            
+    def test_key_type_str(self):
+        table = StringHashTable(key_type=str)
+        self.assertNotIn("_hash", vars(table))
+        keys = ["a", "abcdefgh", "a much longer key"] + [f"k{i}" for i in range(100)]
+        for i, key in enumerate(keys):
+            table.insert(key, i)
+        # Short keys still use the polynomial hash after resizes
+        self.assertNotIn("_hash", vars(table))
+        self.assertEqual(table._hash("ab"), (ord("a") * 31 + ord("b")) % table.capacity)
+        for i, key in enumerate(keys):
+            self.assertEqual(table.get(key), i)
+            self.assertEqual(table.get_with_hash(key, hash(key)), i)
+        self.assertIsNone(table.get_with_hash("zz", hash("zz")))
+        
+    def test_keys_are_interned(self):
+        key = "".join(["ke", "y"])
+        self.table.insert(key, "value")
+        self.assertIs(self.table.keys()[0], sys.intern("key"))
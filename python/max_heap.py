@@ -1,4 +1,5 @@
 import unittest
+from min_heap import _IntHeap
 
 class MaxHeap:
     """
@@ -94,13 +95,14 @@ class MaxHeap:
         Args:
             index: the index of the element to sift up
         """
-        parent = self._parent_index(index)
-        
-        if parent is not None and self.items[index] > self.items[parent]:
+        items = self.items
+        while index > 0:
+            parent = (index - 1) >> 1
+            if not items[index] > items[parent]:
+                break
             # Swap with parent
-            self.items[index], self.items[parent] = self.items[parent], self.items[index]
-            # Continue sifting up
-            self._sift_up(parent)
+            items[index], items[parent] = items[parent], items[index]
+            index = parent
     
     def _sift_down(self, index):
         """
@@ -109,21 +111,19 @@ class MaxHeap:
         Args:
             index: the index of the element to sift down
         """
-        largest = index
-        left = self._left_child_index(index)
-        right = self._right_child_index(index)
-        
-        if left is not None and self.items[left] > self.items[largest]:
-            largest = left
-            
-        if right is not None and self.items[right] > self.items[largest]:
-            largest = right
-            
-        if largest != index:
+        items = self.items
+        n = len(items)
+        # Only non-leaf nodes, i.e. indices below n // 2, have children
+        half = n >> 1
+        while index < half:
+            left = 2 * index + 1
+            right = left + 1
+            child = right if right < n and items[right] > items[left] else left
+            if not items[child] > items[index]:
+                break
             # Swap with the largest child
-            self.items[index], self.items[largest] = self.items[largest], self.items[index]
-            # Continue sifting down
-            self._sift_down(largest)
+            items[index], items[child] = items[child], items[index]
+            index = child
     
     def insert(self, value) -> None:
         """
@@ -190,6 +190,22 @@ class MaxHeap:
         self.items = []
 
 
+class IntMaxHeap(_IntHeap):
+    """
+    A max heap specialized for 64-bit signed integers, stored in 8 bytes each.
+    
+    It has the same methods as MaxHeap but is not a subclass, since items is an
+    int64 buffer rather than a list.
+    
+    Methods:
+        - insert(value) add value to the heap
+        - extract_max() remove and return the maximum value
+        - peek() return the maximum value without removing it
+    """
+    _compare = ">"
+    extract_max = _IntHeap._extract
+
+
 class TestMaxHeap(unittest.TestCase):
     def setUp(self):
         self.heap = MaxHeap()
@@ -274,6 +290,12 @@ class TestMaxHeap(unittest.TestCase):
             if right is not None:
                 self.assertGreaterEqual(self.heap.items[i], self.heap.items[right])
         
+    def test_many_values(self):
+        values = [(i * 37) % 101 for i in range(200)]
+        for v in values:
+            self.heap.insert(v)
+        self.assertEqual([self.heap.extract_max() for _ in values], sorted(values, reverse=True))
+        
     def test_clear(self):
         for i in range(5):
             self.heap.insert(i)
@@ -284,5 +306,43 @@ class TestMaxHeap(unittest.TestCase):
         self.assertEqual(len(self.heap), 0)
         self.assertTrue(self.heap.is_empty())
 
+class TestIntMaxHeap(unittest.TestCase):
+    def setUp(self):
+        self.heap = IntMaxHeap(capacity=2)
+        
+    def test_standalone(self):
+        self.assertNotIsInstance(self.heap, MaxHeap)
+        
+    def test_extract_max(self):
+        with self.assertRaises(IndexError):
+            self.heap.extract_max()
+            
+        values = [5, -3, 7, 1, 2**40, 2, -2**40, 4, 5]
+        for v in values:
+            self.heap.insert(v)
+            
+        self.assertEqual(len(self.heap), len(values))
+        self.assertEqual(self.heap.peek(), sorted(values, reverse=True)[0])
+        self.assertEqual([self.heap.extract_max() for _ in values], sorted(values, reverse=True))
+        self.assertTrue(self.heap.is_empty())
+        
+    def test_contains(self):
+        self.heap.insert(5)
+        self.heap.insert(3)
+        self.assertTrue(5 in self.heap)
+        self.assertFalse(10 in self.heap)
+        
+    def test_rejects_non_integers(self):
+        with self.assertRaises(TypeError):
+            self.heap.insert(1.5)
+        with self.assertRaises(ValueError):
+            self.heap.insert(2**63)
+            
+    def test_clear(self):
+        self.heap.insert(1)
+        self.heap.clear()
+        self.assertTrue(self.heap.is_empty())
+        self.assertEqual(str(self.heap), "[]")
+
 if __name__ == '__main__':
     unittest.main()
@@ -94,13 +94,14 @@ class MinHeap:
         Args:
             index: the index of the element to sift up
         """
-        parent = self._parent_index(index)
-        
-        if parent is not None and self.items[index] < self.items[parent]:
+        items = self.items
+        while index > 0:
+            parent = (index - 1) >> 1
+            if not items[index] < items[parent]:
+                break
             # Swap with parent
-            self.items[index], self.items[parent] = self.items[parent], self.items[index]
-            # Continue sifting up
-            self._sift_up(parent)
+            items[index], items[parent] = items[parent], items[index]
+            index = parent
     
     def _sift_down(self, index):
         """
@@ -109,21 +110,19 @@ class MinHeap:
         Args:
             index: the index of the element to sift down
         """
-        smallest = index
-        left = self._left_child_index(index)
-        right = self._right_child_index(index)
-        
-        if left is not None and self.items[left] < self.items[smallest]:
-            smallest = left
-            
-        if right is not None and self.items[right] < self.items[smallest]:
-            smallest = right
-            
-        if smallest != index:
+        items = self.items
+        n = len(items)
+        # Only non-leaf nodes, i.e. indices below n // 2, have children
+        half = n >> 1
+        while index < half:
+            left = 2 * index + 1
+            right = left + 1
+            child = right if right < n and items[right] < items[left] else left
+            if not items[child] < items[index]:
+                break
             # Swap with the smallest child
-            self.items[index], self.items[smallest] = self.items[smallest], self.items[index]
-            # Continue sifting down
-            self._sift_down(smallest)
+            items[index], items[child] = items[child], items[index]
+            index = child
     
     def insert(self, value) -> None:
         """
@@ -190,6 +189,240 @@ class MinHeap:
         self.items = []
 
 
+# Sift methods of _IntHeap, specialized per subclass on the comparison operator
+_SIFT_SOURCE = '''
+def _sift_up(self, index):
+    """
+    Move the element at the specified index up the heap until the heap property is restored.
+    
+    Args:
+        index: the index of the element to sift up
+    """
+    items = self.items
+    value = items[index]
+    while index > 0:
+        parent = (index - 1) >> 1
+        if not value {op} items[parent]:
+            break
+        items[index] = items[parent]
+        index = parent
+    items[index] = value
+    
+def _sift_down(self, index):
+    """
+    Move the element at the specified index down the heap until the heap property is restored.
+    
+    Args:
+        index: the index of the element to sift down
+    """
+    items = self.items
+    n = self._n
+    value = items[index]
+    while True:
+        child = 2 * index + 1
+        if child >= n:
+            break
+        if child + 1 < n and items[child + 1] {op} items[child]:
+            child += 1
+        if not items[child] {op} value:
+            break
+        items[index] = items[child]
+        index = child
+    items[index] = value
+'''
+
+class _IntHeap:
+    """
+    Shared implementation of IntMinHeap and IntMaxHeap.
+    
+    Values are stored in a preallocated buffer of C int64s that grows
+    geometrically, so the heap takes 8 bytes per element instead of a pointer
+    plus a boxed int. Reads from the buffer still produce Python ints, so
+    comparisons cost the same as for a list-backed heap.
+    
+    The buffer is a memoryview cast to 'q' rather than an array.array, since this
+    package's own array module shadows the standard library one when the files
+    are run directly.
+    
+    Subclasses set _compare to the operator that is true when its left operand
+    belongs above its right one ("<" for a min heap). The sift methods are
+    generated from _SIFT_SOURCE with that operator written inline, so sharing
+    the implementation adds no call per comparison.
+    """
+    _compare = "<"
+    
+    def __init_subclass__(cls, **kwargs):
+        """
+        Generate the sift methods of a subclass for its comparison operator.
+        """
+        super().__init_subclass__(**kwargs)
+        namespace: dict = {}
+        exec(_SIFT_SOURCE.format(op=cls._compare), namespace)
+        cls._sift_up = namespace["_sift_up"]
+        cls._sift_down = namespace["_sift_down"]
+        
+    def __init__(self, capacity: int = 16):
+        """
+        Initialize an empty integer heap.
+        
+        Args:
+            capacity: the number of elements to preallocate room for (default: 16)
+        """
+        self.items = memoryview(bytearray(8 * max(capacity, 1))).cast('q')
+        self._n = 0
+        
+    def __str__(self) -> str:
+        """
+        Return the string representation of the heap.
+        """
+        return f"{self.items[:self._n].tolist()}"
+        
+    def __repr__(self) -> str:
+        """
+        Return the string representation of the heap.
+        """
+        return f"{type(self).__name__}({self.items[:self._n].tolist()})"
+        
+    def __len__(self) -> int:
+        """
+        Return the number of elements in the heap.
+        """
+        return self._n
+        
+    def __contains__(self, value) -> bool:
+        """
+        Check if the value is in the heap.
+        
+        Args:
+            value: the value to check
+        """
+        return value in self.items[:self._n].tolist()
+        
+    def _parent_index(self, index):
+        """
+        Get the parent index of the element at the specified index.
+        
+        Args:
+            index: the index of the element
+            
+        Returns:
+            The parent index or None if the element is the root
+        """
+        if index <= 0:
+            return None
+        return (index - 1) // 2
+        
+    def _left_child_index(self, index):
+        """
+        Get the left child index of the element at the specified index.
+        
+        Args:
+            index: the index of the element
+            
+        Returns:
+            The left child index or None if there is no left child
+        """
+        left = 2 * index + 1
+        return left if left < self._n else None
+        
+    def _right_child_index(self, index):
+        """
+        Get the right child index of the element at the specified index.
+        
+        Args:
+            index: the index of the element
+            
+        Returns:
+            The right child index or None if there is no right child
+        """
+        right = 2 * index + 2
+        return right if right < self._n else None
+        
+    def insert(self, value) -> None:
+        """
+        Insert a value into the heap.
+        
+        Args:
+            value: the value to insert
+            
+        Raises:
+            TypeError: if the value is not an integer
+            ValueError: if the value does not fit in a signed 64-bit integer
+        """
+        if self._n == len(self.items):
+            grown = memoryview(bytearray(16 * self._n)).cast('q')
+            grown[:self._n] = self.items
+            self.items = grown
+        self.items[self._n] = value
+        self._n += 1
+        self._sift_up(self._n - 1)
+        
+    def _extract(self):
+        """
+        Remove and return the value at the top of the heap.
+        
+        Returns:
+            The top value
+            
+        Raises:
+            IndexError: if the heap is empty
+        """
+        if self._n == 0:
+            raise IndexError("Cannot extract from an empty heap")
+            
+        top = self.items[0]
+        self._n -= 1
+        if self._n > 0:
+            self.items[0] = self.items[self._n]
+            self._sift_down(0)
+        return top
+        
+    def peek(self):
+        """
+        Return the value at the top of the heap without removing it.
+        
+        Returns:
+            The top value
+            
+        Raises:
+            IndexError: if the heap is empty
+        """
+        if self._n == 0:
+            raise IndexError("Cannot peek at an empty heap")
+        return self.items[0]
+        
+    def is_empty(self) -> bool:
+        """
+        Check if the heap is empty.
+        
+        Returns:
+            True if the heap is empty, False otherwise
+        """
+        return self._n == 0
+        
+    def clear(self) -> None:
+        """
+        Remove all elements from the heap.
+        """
+        self._n = 0
+
+
+class IntMinHeap(_IntHeap):
+    """
+    A min heap specialized for 64-bit signed integers, stored in 8 bytes each.
+    
+    It has the same methods as MinHeap but is not a subclass, since items is an
+    int64 buffer rather than a list.
+    
+    Methods:
+        - insert(value) add value to the heap
+        - extract_min() remove and return the minimum value
+        - peek() return the minimum value without removing it
+    """
+    _compare = "<"
+    extract_min = _IntHeap._extract
+
+
 class TestMinHeap(unittest.TestCase):
     def setUp(self):
         self.heap = MinHeap()
@@ -274,6 +507,12 @@ class TestMinHeap(unittest.TestCase):
             if right is not None:
                 self.assertLessEqual(self.heap.items[i], self.heap.items[right])
         
+    def test_many_values(self):
+        values = [(i * 37) % 101 for i in range(200)]
+        for v in values:
+            self.heap.insert(v)
+        self.assertEqual([self.heap.extract_min() for _ in values], sorted(values))
+        
     def test_clear(self):
         for i in range(5):
             self.heap.insert(i)
@@ -284,5 +523,45 @@ class TestMinHeap(unittest.TestCase):
         self.assertEqual(len(self.heap), 0)
         self.assertTrue(self.heap.is_empty())
 
+class TestIntMinHeap(unittest.TestCase):
+    def setUp(self):
+        self.heap = IntMinHeap(capacity=2)
+        
+    def test_standalone(self):
+        self.assertNotIsInstance(self.heap, MinHeap)
+        self.assertEqual(self.heap._parent_index(0), None)
+        self.assertEqual(self.heap._parent_index(4), 1)
+        
+    def test_extract_min(self):
+        with self.assertRaises(IndexError):
+            self.heap.extract_min()
+            
+        values = [5, -3, 7, 1, 2**40, 2, -2**40, 4, 5]
+        for v in values:
+            self.heap.insert(v)
+            
+        self.assertEqual(len(self.heap), len(values))
+        self.assertEqual(self.heap.peek(), sorted(values)[0])
+        self.assertEqual([self.heap.extract_min() for _ in values], sorted(values))
+        self.assertTrue(self.heap.is_empty())
+        
+    def test_contains(self):
+        self.heap.insert(5)
+        self.heap.insert(3)
+        self.assertTrue(5 in self.heap)
+        self.assertFalse(10 in self.heap)
+        
+    def test_rejects_non_integers(self):
+        with self.assertRaises(TypeError):
+            self.heap.insert(1.5)
+        with self.assertRaises(ValueError):
+            self.heap.insert(2**63)
+            
+    def test_clear(self):
+        self.heap.insert(1)
+        self.heap.clear()
+        self.assertTrue(self.heap.is_empty())
+        self.assertEqual(str(self.heap), "[]")
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,22 +1,41 @@
+import heapq
 import unittest
-from min_heap import MinHeap
+from bisect import insort
+from collections import deque
 
 class PriorityQueue:
     """
     PriorityQueue is a data structure where each element has a priority.
     Elements with higher priority are served before elements with lower priority.
     
+    Entries are (priority, entry_count, item) tuples kept in a flat list managed by
+    the C-implemented heapq module.
+    
+    With small=True the list is instead kept fully sorted with bisect.insort while
+    it holds at most SMALL_MAX entries, which beats a heap for tiny queues. A sorted
+    list is already a valid heap, so the queue switches to heapq in place once it
+    grows past that size.
+    
     Methods:
         - enqueue(item, priority) add item with the specified priority
+        - enqueue_many(items_with_priorities) add many items at once
         - dequeue() remove and return the highest priority item
+        - dequeue_all() remove and return all items in priority order
         - peek() return the highest priority item without removing it
     """
-    def __init__(self):
+    SMALL_MAX = 64
+    
+    def __init__(self, small: bool = False):
         """
         Initialize an empty priority queue.
+        
+        Args:
+            small: keep entries in a sorted list while the queue is small (default: False)
         """
-        self.heap = MinHeap()
+        self.heap = []
         self.entry_count = 0  # To break ties for same priorities
+        self.small = small
+        self._sorted = small
         
     def __str__(self) -> str:
         """
@@ -48,7 +67,41 @@ class PriorityQueue:
         # entry_count is used to break ties for items with the same priority
         entry = (priority, self.entry_count, item)
         self.entry_count += 1
-        self.heap.insert(entry)
+        if self._sorted:
+            insort(self.heap, entry)
+            if len(self.heap) > self.SMALL_MAX:
+                self._sorted = False
+        else:
+            heapq.heappush(self.heap, entry)
+        
+    def enqueue_many(self, items_with_priorities) -> None:
+        """
+        Add many (item, priority) pairs at once.
+        
+        When the batch is large compared to the queue, the entries are appended in
+        one go and the whole list is rebuilt with heapq.heapify, which is O(n)
+        instead of O(k log n) for k separate pushes.
+        
+        Args:
+            items_with_priorities: an iterable of (item, priority) pairs
+        """
+        start = self.entry_count
+        entries = [(priority, start + offset, item)
+                   for offset, (item, priority) in enumerate(items_with_priorities)]
+        self.entry_count += len(entries)
+        
+        heap = self.heap
+        if self._sorted:
+            heap.extend(entries)
+            heap.sort()
+            if len(heap) > self.SMALL_MAX:
+                self._sorted = False
+        elif len(entries) > len(heap) // 2:
+            heap.extend(entries)
+            heapq.heapify(heap)
+        else:
+            for entry in entries:
+                heapq.heappush(heap, entry)
         
     def dequeue(self):
         """
@@ -60,11 +113,29 @@ class PriorityQueue:
         Raises:
             IndexError: if the priority queue is empty
         """
-        if len(self.heap) == 0:
+        if not self.heap:
             raise IndexError("Cannot dequeue from an empty priority queue")
             
-        priority, _, item = self.heap.extract_min()
-        return item
+        if self._sorted:
+            return self.heap.pop(0)[2]
+        return heapq.heappop(self.heap)[2]
+        
+    def dequeue_all(self) -> list:
+        """
+        Remove and return every item in priority order.
+        
+        Draining the queue with one sort is much cheaper than calling dequeue
+        once per item, since the ordering work happens in a single C-level call.
+        
+        Returns:
+            A list of all items, highest priority first
+        """
+        heap = self.heap
+        heap.sort()
+        items = [entry[2] for entry in heap]
+        heap.clear()
+        self._sorted = self.small
+        return items
         
     def peek(self):
         """
@@ -76,11 +147,10 @@ class PriorityQueue:
         Raises:
             IndexError: if the priority queue is empty
         """
-        if len(self.heap) == 0:
+        if not self.heap:
             raise IndexError("Cannot peek at an empty priority queue")
             
-        priority, _, item = self.heap.peek()
-        return item
+        return self.heap[0][2]
     
     def is_empty(self) -> bool:
         """
@@ -89,7 +159,20 @@ class PriorityQueue:
         Returns:
             True if the priority queue is empty, False otherwise
         """
-        return self.heap.is_empty()
+        return not self.heap
+        
+    @classmethod
+    def from_bucket(cls, max_priority: int) -> "BucketPriorityQueue":
+        """
+        Create a bucket-based priority queue for small non-negative integer priorities.
+        
+        Args:
+            max_priority: the largest priority that will be enqueued
+            
+        Returns:
+            An empty BucketPriorityQueue
+        """
+        return BucketPriorityQueue(max_priority)
         
     def clear(self) -> None:
         """
@@ -97,6 +180,357 @@ class PriorityQueue:
         """
         self.heap.clear()
         self.entry_count = 0
+        self._sorted = self.small
+
+
+class DaryPriorityQueue:
+    """
+    A priority queue backed by a pure-Python d-ary heap (4-ary by default).
+    
+    A wider fan-out halves the height of the heap compared to a binary heap, and
+    the children of a node sit next to each other in the backing lists, so a
+    sift-down scans one contiguous run of siblings per level.
+    
+    Entries are stored as three parallel lists (priorities, counts, items) rather
+    than one list of tuples: no tuple is allocated per entry, and sift-down reads
+    only the priorities and counts it compares.
+    
+    In CPython this is about 3x slower than PriorityQueue, whose binary heap runs
+    in C through heapq; prefer PriorityQueue unless the arity itself matters.
+    
+    Methods:
+        - enqueue(item, priority) add item with the specified priority
+        - enqueue_many(items_with_priorities) add many items at once
+        - dequeue() remove and return the highest priority item
+        - dequeue_all() remove and return all items in priority order
+        - peek() return the highest priority item without removing it
+    """
+    def __init__(self, arity: int = 4):
+        """
+        Initialize an empty d-ary priority queue.
+        
+        Args:
+            arity: the number of children per heap node (default: 4)
+            
+        Raises:
+            ValueError: if arity is less than 2
+        """
+        if arity < 2:
+            raise ValueError("Arity must be at least 2")
+        self.arity = arity
+        self.priorities = []
+        self.counts = []
+        self.items = []
+        self.entry_count = 0
+        
+    def __str__(self) -> str:
+        """
+        Return the string representation of the priority queue.
+        """
+        return f"DaryPriorityQueue({list(zip(self.priorities, self.counts, self.items))})"
+        
+    def __repr__(self) -> str:
+        """
+        Return the string representation of the priority queue.
+        """
+        return self.__str__()
+        
+    def __len__(self) -> int:
+        """
+        Return the number of elements in the priority queue.
+        """
+        return len(self.items)
+        
+    def enqueue(self, item, priority) -> None:
+        """
+        Add an item with the specified priority.
+        
+        Args:
+            item: the item to add
+            priority: the priority of the item (lower number = higher priority)
+        """
+        count = self.entry_count
+        self.entry_count += 1
+        
+        priorities, counts, items = self.priorities, self.counts, self.items
+        arity = self.arity
+        priorities.append(priority)
+        counts.append(count)
+        items.append(item)
+        
+        # The new entry has the largest count, so it only moves above a parent
+        # with a strictly larger priority
+        index = len(items) - 1
+        while index > 0:
+            parent = (index - 1) // arity
+            if not priority < priorities[parent]:
+                break
+            priorities[index] = priorities[parent]
+            counts[index] = counts[parent]
+            items[index] = items[parent]
+            index = parent
+        priorities[index] = priority
+        counts[index] = count
+        items[index] = item
+        
+    def enqueue_many(self, items_with_priorities) -> None:
+        """
+        Add many (item, priority) pairs at once.
+        
+        Args:
+            items_with_priorities: an iterable of (item, priority) pairs
+        """
+        enqueue = self.enqueue
+        for item, priority in items_with_priorities:
+            enqueue(item, priority)
+        
+    def dequeue(self):
+        """
+        Remove and return the highest priority item.
+        
+        Returns:
+            The highest priority item
+            
+        Raises:
+            IndexError: if the priority queue is empty
+        """
+        priorities, counts, items = self.priorities, self.counts, self.items
+        if not items:
+            raise IndexError("Cannot dequeue from an empty priority queue")
+            
+        priority = priorities.pop()
+        count = counts.pop()
+        item = items.pop()
+        if not items:
+            return item
+        top = items[0]
+        
+        # Sift the former last entry down from the root
+        arity = self.arity
+        n = len(items)
+        index = 0
+        while True:
+            first = arity * index + 1
+            if first >= n:
+                break
+            best = first
+            best_priority = priorities[first]
+            best_count = counts[first]
+            for child in range(first + 1, min(first + arity, n)):
+                child_priority = priorities[child]
+                if child_priority < best_priority or (child_priority == best_priority and counts[child] < best_count):
+                    best = child
+                    best_priority = child_priority
+                    best_count = counts[child]
+            if not (best_priority < priority or (best_priority == priority and best_count < count)):
+                break
+            priorities[index] = best_priority
+            counts[index] = best_count
+            items[index] = items[best]
+            index = best
+        priorities[index] = priority
+        counts[index] = count
+        items[index] = item
+        return top
+        
+    def dequeue_all(self) -> list:
+        """
+        Remove and return every item in priority order.
+        
+        Returns:
+            A list of all items, highest priority first
+        """
+        # Counts are unique, so items themselves are never compared
+        entries = sorted(zip(self.priorities, self.counts, self.items))
+        self.priorities.clear()
+        self.counts.clear()
+        self.items.clear()
+        return [entry[2] for entry in entries]
+        
+    def peek(self):
+        """
+        Return the highest priority item without removing it.
+        
+        Returns:
+            The highest priority item
+            
+        Raises:
+            IndexError: if the priority queue is empty
+        """
+        if not self.items:
+            raise IndexError("Cannot peek at an empty priority queue")
+        return self.items[0]
+        
+    def is_empty(self) -> bool:
+        """
+        Check if the priority queue is empty.
+        
+        Returns:
+            True if the priority queue is empty, False otherwise
+        """
+        return not self.items
+        
+    def clear(self) -> None:
+        """
+        Remove all elements from the priority queue.
+        """
+        self.priorities.clear()
+        self.counts.clear()
+        self.items.clear()
+        self.entry_count = 0
+
+
+class BucketPriorityQueue:
+    """
+    A priority queue for integer priorities in the range [0, max_priority] (Dial's buckets).
+    
+    Each priority has its own FIFO bucket, so enqueue is O(1) and dequeue is amortized
+    O(1) for monotone workloads such as schedulers and shortest-path searches, instead
+    of O(log n) for a heap. Items with equal priority are served in insertion order.
+    
+    Methods:
+        - enqueue(item, priority) add item with the specified priority
+        - enqueue_many(items_with_priorities) add many items at once
+        - dequeue() remove and return the highest priority item
+        - dequeue_all() remove and return all items in priority order
+        - peek() return the highest priority item without removing it
+    """
+    def __init__(self, max_priority: int):
+        """
+        Initialize an empty bucket priority queue.
+        
+        Args:
+            max_priority: the largest priority that will be enqueued
+            
+        Raises:
+            ValueError: if max_priority is negative
+        """
+        if max_priority < 0:
+            raise ValueError("Maximum priority must be non-negative")
+        self.buckets = [deque() for _ in range(max_priority + 1)]
+        self.min_idx = max_priority + 1
+        self.count = 0
+        
+    def __str__(self) -> str:
+        """
+        Return the string representation of the priority queue.
+        """
+        return f"BucketPriorityQueue({self.count} items)"
+        
+    def __repr__(self) -> str:
+        """
+        Return the string representation of the priority queue.
+        """
+        return self.__str__()
+        
+    def __len__(self) -> int:
+        """
+        Return the number of elements in the priority queue.
+        """
+        return self.count
+        
+    def enqueue(self, item, priority: int) -> None:
+        """
+        Add an item with the specified priority.
+        
+        Args:
+            item: the item to add
+            priority: the priority of the item (lower number = higher priority)
+            
+        Raises:
+            ValueError: if the priority is outside [0, max_priority]
+        """
+        if not 0 <= priority < len(self.buckets):
+            raise ValueError(f"Priority must be between 0 and {len(self.buckets) - 1}")
+        self.buckets[priority].append(item)
+        if priority < self.min_idx:
+            self.min_idx = priority
+        self.count += 1
+        
+    def enqueue_many(self, items_with_priorities) -> None:
+        """
+        Add many (item, priority) pairs at once.
+        
+        Args:
+            items_with_priorities: an iterable of (item, priority) pairs
+            
+        Raises:
+            ValueError: if a priority is outside [0, max_priority]
+        """
+        enqueue = self.enqueue
+        for item, priority in items_with_priorities:
+            enqueue(item, priority)
+        
+    def _advance(self) -> deque:
+        """
+        Move min_idx past empty buckets and return the first non-empty bucket.
+        """
+        buckets = self.buckets
+        while not buckets[self.min_idx]:
+            self.min_idx += 1
+        return buckets[self.min_idx]
+        
+    def dequeue(self):
+        """
+        Remove and return the highest priority item.
+        
+        Returns:
+            The highest priority item
+            
+        Raises:
+            IndexError: if the priority queue is empty
+        """
+        if self.count == 0:
+            raise IndexError("Cannot dequeue from an empty priority queue")
+        self.count -= 1
+        return self._advance().popleft()
+        
+    def dequeue_all(self) -> list:
+        """
+        Remove and return every item in priority order.
+        
+        Returns:
+            A list of all items, highest priority first
+        """
+        items = []
+        for bucket in self.buckets:
+            items.extend(bucket)
+            bucket.clear()
+        self.min_idx = len(self.buckets)
+        self.count = 0
+        return items
+        
+    def peek(self):
+        """
+        Return the highest priority item without removing it.
+        
+        Returns:
+            The highest priority item
+            
+        Raises:
+            IndexError: if the priority queue is empty
+        """
+        if self.count == 0:
+            raise IndexError("Cannot peek at an empty priority queue")
+        return self._advance()[0]
+        
+    def is_empty(self) -> bool:
+        """
+        Check if the priority queue is empty.
+        
+        Returns:
+            True if the priority queue is empty, False otherwise
+        """
+        return self.count == 0
+        
+    def clear(self) -> None:
+        """
+        Remove all elements from the priority queue.
+        """
+        for bucket in self.buckets:
+            bucket.clear()
+        self.min_idx = len(self.buckets)
+        self.count = 0
 
 
 class TestPriorityQueue(unittest.TestCase):
@@ -155,6 +589,26 @@ class TestPriorityQueue(unittest.TestCase):
         self.assertEqual(self.pq.dequeue(), "Task D")  # Priority 3
         self.assertEqual(self.pq.dequeue(), "Task A")  # Priority 5
         
+    def test_dequeue_all(self):
+        self.assertEqual(self.pq.dequeue_all(), [])
+        
+        for i, priority in enumerate([5, 2, 1, 3, 1, 2]):
+            self.pq.enqueue(f"Task {i}", priority)
+            
+        self.assertEqual(self.pq.dequeue_all(), ["Task 2", "Task 4", "Task 1", "Task 5", "Task 3", "Task 0"])
+        self.assertTrue(self.pq.is_empty())
+        
+    def test_enqueue_many(self):
+        self.pq.enqueue("first", 3)
+        self.pq.enqueue_many((f"Task {i}", (i * 7) % 10) for i in range(100))
+        self.pq.enqueue_many([("late", 0), ("later", 0)])
+        self.assertEqual(len(self.pq), 103)
+        
+        expected = [f"Task {i}" for i in sorted(range(100), key=lambda i: ((i * 7) % 10, i))]
+        expected[10:10] = ["late", "later"]
+        expected.insert(expected.index("Task 9"), "first")
+        self.assertEqual([self.pq.dequeue() for _ in range(103)], expected)
+        
     def test_clear(self):
         for i in range(5):
             self.pq.enqueue(f"Task {i}", i)
@@ -165,5 +619,65 @@ class TestPriorityQueue(unittest.TestCase):
         self.assertEqual(len(self.pq), 0)
         self.assertTrue(self.pq.is_empty())
 
+
+class TestSmallPriorityQueue(TestPriorityQueue):
+    def setUp(self):
+        self.pq = PriorityQueue(small=True)
+        
+    def test_switches_to_heap(self):
+        priorities = [(i * 7919) % 257 for i in range(300)]
+        for i, priority in enumerate(priorities):
+            self.pq.enqueue(i, priority)
+            if i < PriorityQueue.SMALL_MAX:
+                self.assertEqual(self.pq.heap, sorted(self.pq.heap))
+        self.assertFalse(self.pq._sorted)
+        
+        order = [self.pq.dequeue() for _ in priorities]
+        self.assertEqual(order, sorted(range(300), key=lambda i: (priorities[i], i)))
+        
+        self.pq.clear()
+        self.assertTrue(self.pq._sorted)
+
+
+class TestDaryPriorityQueue(TestPriorityQueue):
+    def setUp(self):
+        self.pq = DaryPriorityQueue()
+        
+    def test_arities(self):
+        priorities = [(i * 7919) % 257 for i in range(300)]
+        for arity in (2, 3, 4, 8):
+            pq = DaryPriorityQueue(arity)
+            for i, priority in enumerate(priorities):
+                pq.enqueue(i, priority)
+            order = [pq.dequeue() for _ in priorities]
+            self.assertEqual(order, sorted(range(300), key=lambda i: (priorities[i], i)))
+            
+    def test_invalid_arity(self):
+        with self.assertRaises(ValueError):
+            DaryPriorityQueue(1)
+
+
+class TestBucketPriorityQueue(TestPriorityQueue):
+    def setUp(self):
+        self.pq = PriorityQueue.from_bucket(10)
+        
+    def test_priority_range(self):
+        with self.assertRaises(ValueError):
+            self.pq.enqueue("Task", 11)
+        with self.assertRaises(ValueError):
+            self.pq.enqueue("Task", -1)
+        with self.assertRaises(ValueError):
+            BucketPriorityQueue(-1)
+            
+    def test_interleaved(self):
+        self.pq.enqueue("a", 5)
+        self.pq.enqueue("b", 7)
+        self.assertEqual(self.pq.dequeue(), "a")
+        self.pq.enqueue("c", 2)
+        self.assertEqual(self.pq.peek(), "c")
+        self.assertEqual(self.pq.dequeue(), "c")
+        self.assertEqual(self.pq.dequeue(), "b")
+        self.assertTrue(self.pq.is_empty())
+
 if __name__ == '__main__':
     unittest.main()
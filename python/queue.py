@@ -1,31 +1,40 @@
 import unittest
+from collections import Counter, deque
 
 class Queue:
     """
     Queue is a FIFO (first-in, first-out) data structure.
     
+    Items are kept in a collections.deque so both enqueue and dequeue are O(1).
+    
     Methods:
         - enqueue(value) add value to the end of the queue
         - dequeue() remove and return the first element
         - peek() return the first element without removing it
     """
-    def __init__(self):
+    def __init__(self, track_membership: bool = False):
         """
         Initialize an empty queue.
+        
+        Args:
+            track_membership: keep a count of every queued value so that `in`
+                              checks are O(1); values must then be hashable
+                              (default: False)
         """
-        self.items = []
+        self.items = deque()
+        self._membership = Counter() if track_membership else None
         
     def __str__(self) -> str:
         """
         Return the string representation of the queue.
         """
-        return f"{self.items}"
+        return f"{list(self.items)}"
         
     def __repr__(self) -> str:
         """
         Return the string representation of the queue.
         """
-        return f"Queue({self.items})"
+        return f"Queue({list(self.items)})"
         
     def __len__(self) -> int:
         """
@@ -40,6 +49,8 @@ class Queue:
         Args:
             value: the value to check
         """
+        if self._membership is not None:
+            return self._membership[value] > 0
         return value in self.items
         
     def enqueue(self, value) -> None:
@@ -48,7 +59,12 @@ class Queue:
         
         Args:
             value: the value to add
+            
+        Raises:
+            TypeError: if membership is tracked and the value is unhashable
         """
+        if self._membership is not None:
+            self._membership[value] += 1
         self.items.append(value)
         
     def dequeue(self):
@@ -63,7 +79,12 @@ class Queue:
         """
         if len(self.items) == 0:
             raise IndexError("Cannot dequeue from an empty queue")
-        return self.items.pop(0)
+        value = self.items.popleft()
+        if self._membership is not None:
+            self._membership[value] -= 1
+            if not self._membership[value]:
+                del self._membership[value]
+        return value
         
     def peek(self):
         """
@@ -94,18 +115,18 @@ class TestQueue(unittest.TestCase):
         self.queue = Queue()
         
     def test_init(self):
-        self.assertEqual(self.queue.items, [])
+        self.assertEqual(list(self.queue.items), [])
         self.assertEqual(len(self.queue), 0)
         self.assertTrue(self.queue.is_empty())
         
     def test_enqueue(self):
         self.queue.enqueue(1)
-        self.assertEqual(self.queue.items, [1])
+        self.assertEqual(list(self.queue.items), [1])
         self.assertEqual(len(self.queue), 1)
         self.assertFalse(self.queue.is_empty())
         
         self.queue.enqueue(2)
-        self.assertEqual(self.queue.items, [1, 2])
+        self.assertEqual(list(self.queue.items), [1, 2])
         self.assertEqual(len(self.queue), 2)
         
     def test_dequeue(self):
@@ -117,7 +138,7 @@ class TestQueue(unittest.TestCase):
         
         value = self.queue.dequeue()
         self.assertEqual(value, 1)
-        self.assertEqual(self.queue.items, [2])
+        self.assertEqual(list(self.queue.items), [2])
         self.assertEqual(len(self.queue), 1)
         
     def test_peek(self):
@@ -129,7 +150,7 @@ class TestQueue(unittest.TestCase):
         
         value = self.queue.peek()
         self.assertEqual(value, 1)
-        self.assertEqual(self.queue.items, [1, 2])  # Ensure queue is unchanged
+        self.assertEqual(list(self.queue.items), [1, 2])  # Ensure queue is unchanged
         self.assertEqual(len(self.queue), 2)
         
     def test_contains(self):
@@ -138,6 +159,30 @@ class TestQueue(unittest.TestCase):
         self.assertFalse(2 in self.queue)
         self.assertTrue(1 in self.queue)
         
+    def test_str(self):
+        self.queue.enqueue(1)
+        self.queue.enqueue(2)
+        self.assertEqual(str(self.queue), "[1, 2]")
+        self.assertEqual(repr(self.queue), "Queue([1, 2])")
+        
+    def test_track_membership(self):
+        queue = Queue(track_membership=True)
+        queue.enqueue(1)
+        queue.enqueue(2)
+        queue.enqueue(1)
+        self.assertTrue(1 in queue)
+        self.assertFalse(3 in queue)
+        
+        queue.dequeue()
+        self.assertTrue(1 in queue)
+        queue.dequeue()
+        queue.dequeue()
+        self.assertFalse(1 in queue)
+        self.assertFalse(2 in queue)
+        
+        with self.assertRaises(TypeError):
+            queue.enqueue([1])
+            
     def test_fifo_order(self):
         for i in range(5):
             self.queue.enqueue(i)
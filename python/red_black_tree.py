@@ -1,4 +1,5 @@
 import unittest
+from collections import deque
 from typing import Any, Optional
 
 class Node:
@@ -12,6 +13,8 @@ class Node:
         parent: The parent node
         color: The color of the node (True for red, False for black)
     """
+    __slots__ = ("value", "left", "right", "parent", "color")
+    
     def __init__(self, value: Any):
         self.value = value
         self.left: Optional[Node] = None
@@ -19,6 +22,9 @@ class Node:
         self.parent: Optional[Node] = None
         self.color = True  # True for red, False for black
 
+# Maximum number of deleted nodes kept around for reuse by later inserts
+_FREE_LIST_MAX = 1024
+
 class RedBlackTree:
     """
     A Red-Black Tree is a self-balancing binary search tree with the following properties:
@@ -30,6 +36,7 @@ class RedBlackTree:
     
     Methods:
         - insert(value) add a value to the tree
+        - bulk_load(values) add many values at once
         - delete(value) remove a value from the tree
         - search(value) check if a value exists
         - get_min() get the minimum value
@@ -40,18 +47,22 @@ class RedBlackTree:
         """
         Initialize an empty Red-Black Tree.
         """
-        self.root: Optional[Node] = None
         self.nil = Node(None)  # Sentinel node
         self.nil.color = False
         self.nil.left = self.nil
         self.nil.right = self.nil
         self.nil.parent = self.nil
+        self.root: Node = self.nil
+        self._free: deque = deque(maxlen=_FREE_LIST_MAX)
+        # Cached extreme nodes; None means unknown and is recomputed on demand
+        self._min_node: Optional[Node] = None
+        self._max_node: Optional[Node] = None
         
     def __str__(self) -> str:
         """
         Return the string representation of the tree.
         """
-        return f"RedBlackTree(root={self.root.value if self.root else None})"
+        return f"RedBlackTree(root={self.root.value})"
         
     def __repr__(self) -> str:
         """
@@ -59,6 +70,36 @@ class RedBlackTree:
         """
         return self.__str__()
         
+    def _new_node(self, value: Any) -> Node:
+        """
+        Create a red leaf node, reusing a deleted node when one is available.
+        
+        Args:
+            value: The value to store
+            
+        Returns:
+            The new node
+        """
+        if self._free:
+            node = self._free.pop()
+            node.value = value
+            node.color = True
+        else:
+            node = Node(value)
+        node.left = node.right = node.parent = self.nil
+        return node
+        
+    def _recycle(self, node: Node) -> None:
+        """
+        Return a node that is no longer part of the tree to the free list.
+        
+        Args:
+            node: The detached node
+        """
+        node.value = None
+        node.left = node.right = node.parent = None
+        self._free.append(node)
+        
     def _left_rotate(self, x: Node) -> None:
         """
         Perform a left rotation around node x.
@@ -68,12 +109,12 @@ class RedBlackTree:
         """
         y = x.right
         x.right = y.left
-        if y.left != self.nil:
+        if y.left is not self.nil:
             y.left.parent = x
         y.parent = x.parent
-        if x.parent == self.nil:
+        if x.parent is self.nil:
             self.root = y
-        elif x == x.parent.left:
+        elif x is x.parent.left:
             x.parent.left = y
         else:
             x.parent.right = y
@@ -89,12 +130,12 @@ class RedBlackTree:
         """
         y = x.left
         x.left = y.right
-        if y.right != self.nil:
+        if y.right is not self.nil:
             y.right.parent = x
         y.parent = x.parent
-        if x.parent == self.nil:
+        if x.parent is self.nil:
             self.root = y
-        elif x == x.parent.right:
+        elif x is x.parent.right:
             x.parent.right = y
         else:
             x.parent.left = y
@@ -109,34 +150,38 @@ class RedBlackTree:
             z: The newly inserted node
         """
         while z.parent.color:
-            if z.parent == z.parent.parent.left:
-                y = z.parent.parent.right
+            parent = z.parent
+            grandparent = parent.parent
+            if parent is grandparent.left:
+                y = grandparent.right
                 if y.color:
-                    z.parent.color = False
+                    parent.color = False
                     y.color = False
-                    z.parent.parent.color = True
-                    z = z.parent.parent
+                    grandparent.color = True
+                    z = grandparent
                 else:
-                    if z == z.parent.right:
-                        z = z.parent
+                    if z is parent.right:
+                        z = parent
                         self._left_rotate(z)
-                    z.parent.color = False
-                    z.parent.parent.color = True
-                    self._right_rotate(z.parent.parent)
+                        parent = z.parent
+                    parent.color = False
+                    grandparent.color = True
+                    self._right_rotate(grandparent)
             else:
-                y = z.parent.parent.left
+                y = grandparent.left
                 if y.color:
-                    z.parent.color = False
+                    parent.color = False
                     y.color = False
-                    z.parent.parent.color = True
-                    z = z.parent.parent
+                    grandparent.color = True
+                    z = grandparent
                 else:
-                    if z == z.parent.left:
-                        z = z.parent
+                    if z is parent.left:
+                        z = parent
                         self._right_rotate(z)
-                    z.parent.color = False
-                    z.parent.parent.color = True
-                    self._left_rotate(z.parent.parent)
+                        parent = z.parent
+                    parent.color = False
+                    grandparent.color = True
+                    self._left_rotate(grandparent)
         self.root.color = False
         
     def _transplant(self, u: Node, v: Node) -> None:
@@ -147,9 +192,9 @@ class RedBlackTree:
             u: The node to replace
             v: The node to replace with
         """
-        if u.parent == self.nil:
+        if u.parent is self.nil:
             self.root = v
-        elif u == u.parent.left:
+        elif u is u.parent.left:
             u.parent.left = v
         else:
             u.parent.right = v
@@ -162,48 +207,49 @@ class RedBlackTree:
         Args:
             x: The node to start fixing from
         """
-        while x != self.root and not x.color:
-            if x == x.parent.left:
-                w = x.parent.right
+        while x is not self.root and not x.color:
+            parent = x.parent
+            if x is parent.left:
+                w = parent.right
                 if w.color:
                     w.color = False
-                    x.parent.color = True
-                    self._left_rotate(x.parent)
-                    w = x.parent.right
+                    parent.color = True
+                    self._left_rotate(parent)
+                    w = parent.right
                 if not w.left.color and not w.right.color:
                     w.color = True
-                    x = x.parent
+                    x = parent
                 else:
                     if not w.right.color:
                         w.left.color = False
                         w.color = True
                         self._right_rotate(w)
-                        w = x.parent.right
-                    w.color = x.parent.color
-                    x.parent.color = False
+                        w = parent.right
+                    w.color = parent.color
+                    parent.color = False
                     w.right.color = False
-                    self._left_rotate(x.parent)
+                    self._left_rotate(parent)
                     x = self.root
             else:
-                w = x.parent.left
+                w = parent.left
                 if w.color:
                     w.color = False
-                    x.parent.color = True
-                    self._right_rotate(x.parent)
-                    w = x.parent.left
+                    parent.color = True
+                    self._right_rotate(parent)
+                    w = parent.left
                 if not w.right.color and not w.left.color:
                     w.color = True
-                    x = x.parent
+                    x = parent
                 else:
                     if not w.left.color:
                         w.right.color = False
                         w.color = True
                         self._left_rotate(w)
-                        w = x.parent.left
-                    w.color = x.parent.color
-                    x.parent.color = False
+                        w = parent.left
+                    w.color = parent.color
+                    parent.color = False
                     w.left.color = False
-                    self._right_rotate(x.parent)
+                    self._right_rotate(parent)
                     x = self.root
         x.color = False
         
@@ -214,35 +260,77 @@ class RedBlackTree:
         Args:
             value: The value to insert
         """
-        z = Node(value)
-        y = self.nil
+        nil = self.nil
+        z = self._new_node(value)
+        y = nil
         x = self.root
         
         # Find the insertion position
-        while x != self.nil:
+        go_left = False
+        while x is not nil:
             y = x
-            if z.value < x.value:
-                x = x.left
-            else:
-                x = x.right
+            go_left = value < x.value
+            x = x.left if go_left else x.right
                 
         # Insert the node
         z.parent = y
-        if y == self.nil:
+        if y is nil:
             self.root = z
-        elif z.value < y.value:
+        elif go_left:
             y.left = z
         else:
             y.right = z
             
-        # Set initial properties
-        z.left = self.nil
-        z.right = self.nil
-        z.color = True
-        
+        # Keep the cached extremes current
+        if self._min_node is not None and value < self._min_node.value:
+            self._min_node = z
+        if self._max_node is not None and self._max_node.value < value:
+            self._max_node = z
+            
         # Fix the tree properties
         self._insert_fixup(z)
         
+    def bulk_load(self, values) -> None:
+        """
+        Insert many values at once.
+        
+        The new values are merged with the existing ones in sorted order and
+        the tree is rebuilt by recursive midpoint splits. Every level is black
+        except the deepest, partially filled one, which is red, so the result
+        satisfies all Red-Black properties without any rotations or fixups.
+        
+        Args:
+            values: An iterable of values to insert
+        """
+        ordered = sorted(values)
+        if not ordered:
+            return
+        if self.root is not self.nil:
+            ordered = sorted(self.inorder_traversal() + ordered)
+            
+        nil = self.nil
+        # Levels above this depth are complete; only this one is partially filled
+        red_depth = (len(ordered) + 1).bit_length() - 1
+        
+        def build(lo: int, hi: int, depth: int) -> Node:
+            if lo > hi:
+                return nil
+            mid = (lo + hi) // 2
+            node = self._new_node(ordered[mid])
+            node.color = depth == red_depth
+            node.left = build(lo, mid - 1, depth + 1)
+            node.right = build(mid + 1, hi, depth + 1)
+            if node.left is not nil:
+                node.left.parent = node
+            if node.right is not nil:
+                node.right.parent = node
+            return node
+            
+        self.root = build(0, len(ordered) - 1, 0)
+        self.root.parent = nil
+        self._min_node = None
+        self._max_node = None
+        
     def delete(self, value: Any) -> bool:
         """
         Delete a value from the Red-Black Tree.
@@ -254,23 +342,28 @@ class RedBlackTree:
             True if the value was deleted, False if it wasn't found
         """
         z = self._find_node(value)
-        if z == self.nil:
+        if z is self.nil:
             return False
             
+        if z is self._min_node:
+            self._min_node = None
+        if z is self._max_node:
+            self._max_node = None
+            
         y = z
         y_original_color = y.color
         
-        if z.left == self.nil:
+        if z.left is self.nil:
             x = z.right
             self._transplant(z, z.right)
-        elif z.right == self.nil:
+        elif z.right is self.nil:
             x = z.left
             self._transplant(z, z.left)
         else:
             y = self._minimum(z.right)
             y_original_color = y.color
             x = y.right
-            if y.parent == z:
+            if y.parent is z:
                 x.parent = y
             else:
                 self._transplant(y, y.right)
@@ -284,6 +377,7 @@ class RedBlackTree:
         if not y_original_color:
             self._delete_fixup(x)
             
+        self._recycle(z)
         return True
         
     def search(self, value: Any) -> bool:
@@ -296,7 +390,7 @@ class RedBlackTree:
         Returns:
             True if the value exists, False otherwise
         """
-        return self._find_node(value) != self.nil
+        return self._find_node(value) is not self.nil
         
     def get_min(self) -> Optional[Any]:
         """
@@ -305,9 +399,11 @@ class RedBlackTree:
         Returns:
             The minimum value, or None if the tree is empty
         """
-        if self.root == self.nil:
+        if self.root is self.nil:
             return None
-        return self._minimum(self.root).value
+        if self._min_node is None:
+            self._min_node = self._minimum(self.root)
+        return self._min_node.value
         
     def get_max(self) -> Optional[Any]:
         """
@@ -316,9 +412,11 @@ class RedBlackTree:
         Returns:
             The maximum value, or None if the tree is empty
         """
-        if self.root == self.nil:
+        if self.root is self.nil:
             return None
-        return self._maximum(self.root).value
+        if self._max_node is None:
+            self._max_node = self._maximum(self.root)
+        return self._max_node.value
         
     def inorder_traversal(self) -> list:
         """
@@ -328,7 +426,19 @@ class RedBlackTree:
             List of values in sorted order
         """
         result = []
-        self._inorder_traversal(self.root, result)
+        append = result.append
+        stack = []
+        nil = self.nil
+        node = self.root
+        
+        while node is not nil or stack:
+            while node is not nil:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            append(node.value)
+            node = node.right
+            
         return result
         
     def _find_node(self, value: Any) -> Node:
@@ -341,15 +451,14 @@ class RedBlackTree:
         Returns:
             The node with the value, or self.nil if not found
         """
+        nil = self.nil
         current = self.root
-        while current != self.nil:
-            if value == current.value:
+        while current is not nil:
+            current_value = current.value
+            if value == current_value:
                 return current
-            elif value < current.value:
-                current = current.left
-            else:
-                current = current.right
-        return self.nil
+            current = current.left if value < current_value else current.right
+        return nil
         
     def _minimum(self, node: Node) -> Node:
         """
@@ -361,7 +470,8 @@ class RedBlackTree:
         Returns:
             The node with the minimum value
         """
-        while node.left != self.nil:
+        nil = self.nil
+        while node.left is not nil:
             node = node.left
         return node
         
@@ -375,22 +485,10 @@ class RedBlackTree:
         Returns:
             The node with the maximum value
         """
-        while node.right != self.nil:
+        nil = self.nil
+        while node.right is not nil:
             node = node.right
         return node
-        
-    def _inorder_traversal(self, node: Node, result: list) -> None:
-        """
-        Perform an inorder traversal of the tree.
-        
-        Args:
-            node: The current node
-            result: The list to store results
-        """
-        if node != self.nil:
-            self._inorder_traversal(node.left, result)
-            result.append(node.value)
-            self._inorder_traversal(node.right, result)
 
 
 class TestRedBlackTree(unittest.TestCase):
@@ -398,7 +496,7 @@ class TestRedBlackTree(unittest.TestCase):
         self.tree = RedBlackTree()
         
     def test_init(self):
-        self.assertIsNone(self.tree.root)
+        self.assertIs(self.tree.root, self.tree.nil)
         self.assertFalse(self.tree.nil.color)
         
     def test_insert(self):
@@ -447,6 +545,17 @@ class TestRedBlackTree(unittest.TestCase):
         self.assertEqual(self.tree.get_min(), 1)
         self.assertEqual(self.tree.get_max(), 9)
         
+        # Cached extremes follow later inserts and deletes
+        self.tree.insert(0)
+        self.tree.insert(12)
+        self.assertEqual(self.tree.get_min(), 0)
+        self.assertEqual(self.tree.get_max(), 12)
+        self.tree.delete(0)
+        self.tree.delete(12)
+        self.tree.delete(9)
+        self.assertEqual(self.tree.get_min(), 1)
+        self.assertEqual(self.tree.get_max(), 7)
+        
     def test_inorder_traversal(self):
         values = [5, 3, 7, 1, 9, 4, 6, 8]
         for value in values:
@@ -485,34 +594,92 @@ class TestRedBlackTree(unittest.TestCase):
         remaining = [7, 10, 22, 8, 26, 2, 6, 13]
         self.assertEqual(self.tree.inorder_traversal(), sorted(remaining))
         
-    def test_red_black_properties(self):
-        def check_properties(node):
-            if node == self.tree.nil:
-                return True, 0
+    def test_bulk_load(self):
+        for n in range(40):
+            tree = RedBlackTree()
+            tree.bulk_load(range(n, 0, -1))
+            self.assertEqual(tree.inorder_traversal(), list(range(1, n + 1)))
+            if n:
+                self.assertFalse(tree.root.color)
+                self.assertEqual(tree.get_min(), 1)
+                self.assertEqual(tree.get_max(), n)
+            self._check_black_heights(tree)
+            
+        self.tree.insert(10)
+        self.tree.insert(0)
+        self.tree.bulk_load([5, 15, 5])
+        self.assertEqual(self.tree.inorder_traversal(), [0, 5, 5, 10, 15])
+        self.tree.insert(7)
+        self.assertTrue(self.tree.delete(5))
+        self.assertEqual(self.tree.inorder_traversal(), [0, 5, 7, 10, 15])
+        self._check_black_heights(self.tree)
+        
+    def _check_black_heights(self, tree):
+        """
+        Check properties 4 and 5 with an iterative post-order walk, so trees of
+        any height can be validated without hitting the recursion limit.
+        """
+        nil = tree.nil
+        black_height = {id(nil): 1}
+        stack = [(tree.root, False)]
+        
+        while stack:
+            node, children_done = stack.pop()
+            if node is nil:
+                continue
+            if not children_done:
+                stack.append((node, True))
+                stack.append((node.right, False))
+                stack.append((node.left, False))
+                continue
                 
             # Property 4: If a node is red, both children are black
             if node.color:
                 self.assertFalse(node.left.color)
                 self.assertFalse(node.right.color)
                 
-            # Check left and right subtrees
-            left_valid, left_black = check_properties(node.left)
-            right_valid, right_black = check_properties(node.right)
-            
             # Property 5: Every path has same number of black nodes
-            self.assertEqual(left_black, right_black)
-            
-            return left_valid and right_valid, left_black + (0 if node.color else 1)
+            left = black_height[id(node.left)]
+            self.assertEqual(left, black_height[id(node.right)])
+            black_height[id(node)] = left + (0 if node.color else 1)
             
+        return black_height[id(tree.root)]
+        
+    def test_node_reuse(self):
+        for value in range(10):
+            self.tree.insert(value)
+        for value in range(0, 10, 2):
+            self.tree.delete(value)
+        self.assertEqual(len(self.tree._free), 5)
+        
+        for value in range(20, 25):
+            self.tree.insert(value)
+        self.assertEqual(len(self.tree._free), 0)
+        self.assertEqual(self.tree.inorder_traversal(), [1, 3, 5, 7, 9, 20, 21, 22, 23, 24])
+        
+    def test_slots(self):
+        self.tree.insert(1)
+        self.assertFalse(hasattr(self.tree.root, "__dict__"))
+        
+    def test_red_black_properties(self):
         # Insert some values
         values = [7, 3, 18, 10, 22, 8, 11, 26, 2, 6, 13]
         for value in values:
             self.tree.insert(value)
             
         # Check all properties
-        is_valid, _ = check_properties(self.tree.root)
-        self.assertTrue(is_valid)
+        self._check_black_heights(self.tree)
         self.assertFalse(self.tree.root.color)  # Property 2: Root is black
+        
+    def test_red_black_properties_large(self):
+        values = [(i * 7919) % 5003 for i in range(5003)]
+        for value in values:
+            self.tree.insert(value)
+        for value in values[::3]:
+            self.tree.delete(value)
+            
+        self._check_black_heights(self.tree)
+        self.assertEqual(self.tree.inorder_traversal(), sorted(set(values) - set(values[::3])))
 
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
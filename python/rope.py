@@ -1,16 +1,42 @@
+import unittest
+from bisect import bisect_right
+from collections import deque
 from typing import Optional, Tuple, List
 import math
 
 class RopeNode:
-    """Node in a rope data structure."""
-    def __init__(self, text: str = "", weight: int = 0):
-        self.text = text
+    """
+    Node in a rope data structure.
+    
+    A node's text is a view source[start:end] of a possibly larger string, so
+    splitting a node only creates two new views instead of copying both halves.
+    The source string stays alive for as long as any view into it does.
+    """
+    __slots__ = ("source", "start", "end", "text_len", "weight", "left", "right", "parent", "height", "size")
+    
+    def __init__(self, text: str = "", weight: int = 0, start: int = 0, end: Optional[int] = None):
+        self.source = text
+        self.start = start
+        self.end = len(text) if end is None else end
+        # Node text never changes after construction, so its length is cached
+        self.text_len = self.end - start
         self.weight = weight
         self.left: Optional[RopeNode] = None
         self.right: Optional[RopeNode] = None
         self.parent: Optional[RopeNode] = None
-        self.height = 0
-        self.size = len(text)
+        self.height = 1
+        self.size = self.text_len
+    
+    @property
+    def text(self) -> str:
+        """The text held by this node."""
+        return self.source[self.start:self.end]
+
+# Maximum number of characters stored in a single leaf when building a rope from text
+_LEAF_MAX = 1024
+
+# Maximum number of discarded nodes a rope keeps around for reuse
+_FREE_LIST_MAX = 1024
 
 class Rope:
     """
@@ -29,27 +55,177 @@ class Rope:
         """
         Initialize a rope with the given text.
         
+        Texts longer than _LEAF_MAX are split into fixed-size leaves, viewing
+        into the original string, arranged in a balanced tree.
+        
         Args:
             text: The initial text
         """
-        self.root = RopeNode(text, len(text))
+        # Nodes discarded by splits, recycled by _new_node
+        self._free: deque = deque(maxlen=_FREE_LIST_MAX)
+        # Flat (offsets, nodes) lookup index built by build_index, dropped on every edit
+        self._index: Optional[Tuple[List[int], List[RopeNode]]] = None
+        n = len(text)
+        if n > _LEAF_MAX:
+            self.root = self._build_balanced([
+                RopeNode(text, min(_LEAF_MAX, n - i), i, min(i + _LEAF_MAX, n))
+                for i in range(0, n, _LEAF_MAX)
+            ])
+        else:
+            self.root = RopeNode(text, len(text))
+    
+    @classmethod
+    def from_chunks(cls, chunks: List[str]) -> "Rope":
+        """
+        Build a rope from a list of strings in O(n).
+        
+        Each non-empty chunk becomes a leaf of a perfectly balanced tree, which is
+        much cheaper than concatenating the chunks or inserting them one by one.
+        
+        Args:
+            chunks: The strings to concatenate, in order
+            
+        Returns:
+            A rope holding the concatenation of the chunks
+        """
+        rope = cls()
+        rope.root = rope._build_balanced([RopeNode(chunk, len(chunk)) for chunk in chunks if chunk])
+        return rope
+    
+    def _new_node(self, text: str = "", weight: int = 0, start: int = 0, end: Optional[int] = None) -> RopeNode:
+        """Create a node, reusing one from the free list when possible."""
+        if not self._free:
+            return RopeNode(text, weight, start, end)
+        node = self._free.pop()
+        node.source = text
+        node.start = start
+        node.end = len(text) if end is None else end
+        node.text_len = node.end - start
+        node.weight = weight
+        node.height = 1
+        node.size = node.text_len
+        return node
+    
+    def _recycle(self, node: RopeNode) -> None:
+        """Return a node that is no longer part of the tree to the free list."""
+        node.source = ""
+        node.left = node.right = node.parent = None
+        self._free.append(node)
+    
+    def _build_balanced(self, leaves: List[RopeNode]) -> RopeNode:
+        """
+        Build a balanced tree over the given leaves, keeping their order.
+        
+        Each range of chunks is halved under an empty internal node, so sibling
+        subtrees differ in height by at most one and the result satisfies the
+        AVL invariant maintained by later edits.
+        
+        Returns:
+            The root of the new tree
+        """
+        if not leaves:
+            return RopeNode()
+        
+        def build(lo: int, hi: int) -> RopeNode:
+            if hi - lo == 1:
+                return leaves[lo]
+            mid = (lo + hi) // 2
+            parent = self._new_node()
+            self._set_left(parent, build(lo, mid))
+            self._set_right(parent, build(mid, hi))
+            self._update_metadata(parent)
+            return parent
+        
+        return build(0, len(leaves))
     
     def _update_metadata(self, node: RopeNode) -> None:
         """Update node metadata (weight, size, height)."""
         if node is None:
             return
         
-        # Update weight
-        node.weight = len(node.text) + (node.left.weight if node.left else 0)
+        # Every join, split and rotation ends here, so each child is read once
+        # and the branches replace the max() call
+        left = node.left
+        right = node.right
+        text_len = node.text_len
+        if left is None:
+            node.weight = text_len
+            size = text_len
+            height = 0
+        else:
+            node.weight = text_len + left.weight
+            size = text_len + left.size
+            height = left.height
+        if right is not None:
+            size += right.size
+            if right.height > height:
+                height = right.height
+        node.size = size
+        node.height = height + 1
+    
+    def _rebalance_to_root(self, node: RopeNode) -> RopeNode:
+        """
+        Refresh metadata and restore AVL balance from node, whose children just
+        changed, up to the top of its tree.
         
-        # Update size
-        node.size = len(node.text) + (node.left.size if node.left else 0) + (node.right.size if node.right else 0)
+        Returns:
+            The root of the tree containing node
+        """
+        while True:
+            self._update_metadata(node)
+            parent = node.parent
+            balanced = self._balance(node)
+            if parent is None:
+                return balanced
+            if parent.left is node:
+                parent.left = balanced
+            else:
+                parent.right = balanced
+            node = parent
+    
+    def _join(self, left: Optional[RopeNode], middle: RopeNode, right: Optional[RopeNode]) -> RopeNode:
+        """
+        Join two balanced trees with middle placed between them (AVL join).
+        
+        middle is hung from the spine of the taller tree at the first node whose
+        height is within one of the shorter tree, then the path above it is
+        rebalanced, so the result stays balanced in O(|height difference|) steps.
+        
+        Returns:
+            The root of the joined tree
+        """
+        middle.parent = None
+        if left is not None:
+            left.parent = None
+        if right is not None:
+            right.parent = None
+        left_height = left.height if left else 0
+        right_height = right.height if right else 0
         
-        # Update height
-        node.height = 1 + max(
-            node.left.height if node.left else 0,
-            node.right.height if node.right else 0
-        )
+        if left_height > right_height + 1:
+            node = left
+            while node.right is not None and node.right.height > right_height + 1:
+                node = node.right
+            self._set_left(middle, node.right)
+            self._set_right(middle, right)
+            self._update_metadata(middle)
+            self._set_right(node, middle)
+            return self._rebalance_to_root(node)
+        
+        if right_height > left_height + 1:
+            node = right
+            while node.left is not None and node.left.height > left_height + 1:
+                node = node.left
+            self._set_right(middle, node.left)
+            self._set_left(middle, left)
+            self._update_metadata(middle)
+            self._set_left(node, middle)
+            return self._rebalance_to_root(node)
+        
+        self._set_left(middle, left)
+        self._set_right(middle, right)
+        self._update_metadata(middle)
+        return middle
     
     def _balance(self, node: RopeNode) -> RopeNode:
         """Balance the rope at the given node."""
@@ -113,24 +289,61 @@ class Rope:
         if index < 0 or index >= self.root.size:
             raise IndexError("Index out of range")
         
+        if self._index is not None:
+            offsets, nodes = self._index
+            i = bisect_right(offsets, index) - 1
+            return nodes[i], index - offsets[i]
+        
+        # The range check above guarantees the walk ends at a node before
+        # running off the tree, so no None check is needed in the loop
         current = self.root
-        while current:
-            left_size = current.left.size if current.left else 0
+        while True:
+            left = current.left
+            left_size = left.size if left is not None else 0
             if index < left_size:
-                current = current.left
+                current = left
             else:
                 index -= left_size
-                if index < len(current.text):
+                text_len = current.text_len
+                if index < text_len:
                     return current, index
-                index -= len(current.text)
+                index -= text_len
                 current = current.right
+    
+    def build_index(self) -> None:
+        """
+        Build a flat lookup index for read-heavy workloads.
         
-        raise IndexError("Index out of range")
+        The non-empty nodes are laid out in order in a list, next to a parallel list
+        of their starting offsets, so positional lookups become a C-level binary
+        search over contiguous memory instead of a walk through linked nodes. Any
+        edit drops the index; call this again after a batch of edits.
+        """
+        offsets = []
+        nodes = []
+        position = 0
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            if node.text_len:
+                offsets.append(position)
+                nodes.append(node)
+                position += node.text_len
+            node = node.right
+        self._index = (offsets, nodes)
     
-    def _split_at(self, index: int) -> Tuple[RopeNode, RopeNode]:
+    def _split_at(self, index: int) -> Tuple[Optional[RopeNode], Optional[RopeNode]]:
         """
         Split the rope at the given index.
         
+        The leaf holding the index is cut in two, then the path from it to the root
+        is walked once: every ancestor reached from its left side is joined onto the
+        right rope, every ancestor reached from its right side onto the left rope.
+        
         Returns:
             Tuple of (left_rope, right_rope)
         """
@@ -141,33 +354,40 @@ class Rope:
         
         node, local_index = self._find_node_at(index)
         
-        # Split the text in the node
-        left_text = node.text[:local_index]
-        right_text = node.text[local_index:]
-        
-        # Create new nodes
-        left_node = RopeNode(left_text, len(left_text))
-        right_node = RopeNode(right_text, len(right_text))
+        # Split the node into two views of the same source text
+        source, split = node.source, node.start + local_index
+        left = node.left
+        if local_index > 0:
+            left = self._join(left, self._new_node(source, local_index, node.start, split), None)
+        right = self._join(None, self._new_node(source, node.end - split, split, node.end), node.right)
         
-        # Update the tree structure
-        if node.parent:
-            if node == node.parent.left:
-                node.parent.left = left_node
+        # Distribute the ancestors between the two ropes
+        child, parent = node, node.parent
+        while parent is not None:
+            grandparent = parent.parent
+            if parent.left is child:
+                right = self._join(right, parent, parent.right)
             else:
-                node.parent.right = left_node
-            left_node.parent = node.parent
-        
-        # Build the right subtree
-        right_node.left = node.right
-        if node.right:
-            node.right.parent = right_node
-        right_node.parent = node.parent
+                left = self._join(parent.left, parent, left)
+            child, parent = parent, grandparent
+        self._recycle(node)
         
-        # Update metadata
-        self._update_metadata(left_node)
-        self._update_metadata(right_node)
-        
-        return left_node, right_node
+        if left is not None:
+            left.parent = None
+        right.parent = None
+        return left, right
+    
+    def _set_left(self, node: RopeNode, child: Optional[RopeNode]) -> None:
+        """Make child the left child of node."""
+        node.left = child
+        if child is not None:
+            child.parent = node
+    
+    def _set_right(self, node: RopeNode, child: Optional[RopeNode]) -> None:
+        """Make child the right child of node."""
+        node.right = child
+        if child is not None:
+            child.parent = node
     
     def insert(self, index: int, text: str) -> None:
         """
@@ -180,26 +400,9 @@ class Rope:
         if not text:
             return
         
+        self._index = None
         left, right = self._split_at(index)
-        new_node = RopeNode(text, len(text))
-        
-        if left is None:
-            self.root = new_node
-            new_node.right = right
-            if right:
-                right.parent = new_node
-        else:
-            self.root = left
-            current = left
-            while current.right:
-                current = current.right
-            current.right = new_node
-            new_node.parent = current
-            if right:
-                new_node.right = right
-                right.parent = new_node
-        
-        self._update_metadata(self.root)
+        self.root = self._join(left, self._new_node(text, len(text)), right)
     
     def delete(self, start: int, end: int) -> None:
         """
@@ -212,21 +415,17 @@ class Rope:
         if start >= end or start < 0 or end > self.root.size:
             return
         
-        left, right = self._split_at(start)
+        self._index = None
+        left, self.root = self._split_at(start)
         _, right = self._split_at(end - start)
         
         if left is None:
-            self.root = right
-        else:
+            self.root = right if right is not None else self._new_node()
+        elif right is None:
             self.root = left
-            current = left
-            while current.right:
-                current = current.right
-            current.right = right
-            if right:
-                right.parent = current
-        
-        self._update_metadata(self.root)
+        else:
+            # An empty node bridges the two halves
+            self.root = self._join(left, self._new_node(), right)
     
     def substring(self, start: int, end: int) -> str:
         """
@@ -242,27 +441,49 @@ class Rope:
         if start >= end or start < 0 or end > self.root.size:
             return ""
         
+        # A range inside a single leaf is just a slice of that leaf's text
+        node, local_start = self._find_node_at(start)
+        if local_start + (end - start) <= node.text_len:
+            offset = node.start + local_start
+            return node.source[offset:offset + (end - start)]
+        
         result = []
         self._collect_substring(self.root, start, end, result)
         return "".join(result)
     
     def _collect_substring(self, node: RopeNode, start: int, end: int, result: List[str]) -> None:
-        """Collect characters for substring operation."""
-        if node is None:
-            return
-        
-        left_size = node.left.size if node.left else 0
-        if start < left_size:
-            self._collect_substring(node.left, start, min(end, left_size), result)
-        
-        if start < left_size + len(node.text) and end > left_size:
-            text_start = max(0, start - left_size)
-            text_end = min(len(node.text), end - left_size)
-            result.append(node.text[text_start:text_end])
+        """
+        Collect characters for substring operation.
         
-        if end > left_size + len(node.text):
-            self._collect_substring(node.right, max(0, start - left_size - len(node.text)),
-                                 end - left_size - len(node.text), result)
+        Walks the tree iteratively with an explicit stack, only descending into
+        subtrees that overlap [start, end). Pending text pieces are pushed onto the
+        same stack so they are emitted after their left subtree.
+        """
+        append = result.append
+        stack: list = [(node, start, end)]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                append(item)
+                continue
+            
+            node, start, end = item
+            if node is None:
+                continue
+            
+            left = node.left
+            left_size = left.size if left else 0
+            text_len = node.text_len
+            text_end_offset = left_size + text_len
+            
+            # Push in reverse order: right subtree, own text, left subtree
+            if end > text_end_offset:
+                stack.append((node.right, max(0, start - text_end_offset), end - text_end_offset))
+            if start < text_end_offset and end > left_size:
+                offset = node.start
+                stack.append(node.source[offset + max(0, start - left_size):offset + min(text_len, end - left_size)])
+            if start < left_size:
+                stack.append((left, start, min(end, left_size)))
     
     def __len__(self) -> int:
         """Return the length of the rope."""
@@ -270,18 +491,123 @@ class Rope:
     
     def __str__(self) -> str:
         """Convert the rope to a string."""
+        root = self.root
+        if root.left is None and root.right is None:
+            return root.text
         result = []
         self._collect_string(self.root, result)
         return "".join(result)
     
     def _collect_string(self, node: RopeNode, result: List[str]) -> None:
-        """Collect all text in the rope."""
-        if node is None:
-            return
-        self._collect_string(node.left, result)
-        result.append(node.text)
-        self._collect_string(node.right, result)
+        """Collect all text in the rope with an iterative in-order traversal."""
+        append = result.append
+        stack = []
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            append(node.source[node.start:node.end])
+            node = node.right
     
     def clear(self) -> None:
         """Clear the rope."""
-        self.root = RopeNode() 
\ No newline at end of file
+        self.root = RopeNode()
+        self._index = None
+
+
+class TestRope(unittest.TestCase):
+    def test_init(self):
+        self.assertEqual(str(Rope()), "")
+        self.assertEqual(len(Rope()), 0)
+        self.assertEqual(str(Rope("hello")), "hello")
+        
+    def test_insert(self):
+        rope = Rope("hello world")
+        rope.insert(5, ",")
+        self.assertEqual(str(rope), "hello, world")
+        self.assertEqual(len(rope), 12)
+        
+        rope.insert(0, ">> ")
+        rope.insert(len(rope), "!")
+        self.assertEqual(str(rope), ">> hello, world!")
+        self.assertEqual(len(rope), 16)
+        
+    def test_delete(self):
+        rope = Rope("hello, world")
+        rope.delete(5, 7)
+        self.assertEqual(str(rope), "helloworld")
+        self.assertEqual(len(rope), 10)
+        
+        rope.delete(0, len(rope))
+        self.assertEqual(str(rope), "")
+        self.assertEqual(len(rope), 0)
+        
+    def test_substring(self):
+        rope = Rope("hello")
+        rope.insert(5, " world")
+        self.assertEqual(rope.substring(3, 8), "lo wo")
+        self.assertEqual(rope.substring(0, len(rope)), "hello world")
+        self.assertEqual(rope.substring(4, 4), "")
+        
+    def test_stays_balanced(self):
+        rope = Rope()
+        n = 10000
+        for _ in range(n):
+            rope.insert(0, "x")
+        self.assertEqual(len(rope), n)
+        self.assertLessEqual(rope.root.height, 2 * math.log2(n))
+        
+        for i in range(n // 2):
+            index = (i * 31) % len(rope)
+            rope.delete(index, index + 1)
+        self.assertEqual(len(rope), n // 2)
+        self.assertLessEqual(rope.root.height, 2 * math.log2(n))
+        
+    def test_build_index(self):
+        text = "".join(chr(ord("a") + i % 26) for i in range(5000))
+        rope = Rope(text)
+        rope.insert(2500, "inserted")
+        text = text[:2500] + "inserted" + text[2500:]
+        
+        rope.build_index()
+        for start, end in [(0, 10), (1020, 1030), (2495, 2510), (4000, len(text))]:
+            self.assertEqual(rope.substring(start, end), text[start:end])
+            
+        # Edits drop the index
+        rope.delete(0, 100)
+        text = text[100:]
+        self.assertIsNone(rope._index)
+        self.assertEqual(rope.substring(2395, 2410), text[2395:2410])
+        self.assertEqual(str(rope), text)
+        
+    def test_from_chunks(self):
+        chunks = [f"chunk{i};" for i in range(1000)] + ["", "end"]
+        rope = Rope.from_chunks(chunks)
+        text = "".join(chunks)
+        self.assertEqual(str(rope), text)
+        self.assertEqual(len(rope), len(text))
+        self.assertLessEqual(rope.root.height, 11)
+        
+        rope.insert(10, "!")
+        self.assertEqual(str(rope), text[:10] + "!" + text[10:])
+        self.assertEqual(str(Rope.from_chunks([])), "")
+        
+    def test_mixed_edits(self):
+        text = "".join(chr(ord("a") + i % 26) for i in range(3000))
+        rope = Rope(text)
+        for i in range(200):
+            index = (i * 7919) % (len(text) + 1)
+            rope.insert(index, str(i))
+            text = text[:index] + str(i) + text[index:]
+            if i % 3 == 0:
+                start = (i * 104729) % len(text)
+                rope.delete(start, start + 5)
+                text = text[:start] + text[start + 5:]
+                
+        self.assertEqual(str(rope), text)
+        self.assertEqual(len(rope), len(text))
+        self.assertEqual(rope.substring(100, 2100), text[100:2100])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,23 @@
+import operator
+import struct
 import unittest
+from itertools import accumulate
 from typing import Any, Callable, List, Optional, Union
 
+
+def _skip_none(operation: Callable[[Any, Any], Any]) -> Callable[[Any, Any], Any]:
+    """
+    Wrap an operation so that None acts as its identity element.
+    """
+    def combine(a: Any, b: Any) -> Any:
+        if a is None:
+            return b
+        if b is None:
+            return a
+        return operation(a, b)
+    return combine
+
+
 class SegmentTree:
     """
     A Segment Tree is a data structure that efficiently supports range queries
@@ -13,34 +30,51 @@ class SegmentTree:
     
     The tree is implemented using a binary tree structure, where each node
     represents a segment of the array. The root node represents the entire array,
-    and each child node represents half of its parent's segment.
+    and each child node represents half of its parent's segment. Nodes are stored
+    in a flat heap-indexed list and all operations run iteratively.
     
     Methods:
         - update(index, value) update a single element
         - query(start, end) get result of operation on range [start, end]
         - get(index) get value at index
         - set(index, value) set value at index
+        
+    Integer sum trees built from initial_values answer queries from a prefix
+    sum array in O(1) until the first update. For O(log n) range updates see
+    LazySegmentTree.
     """
-    def __init__(self, size: int, operation: Callable[[Any, Any], Any], initial_values: Optional[List[Any]] = None):
+    def __init__(self, size: int, operation: Callable[[Any, Any], Any], initial_values: Optional[List[Any]] = None,
+                 identity: Any = None):
         """
         Initialize a Segment Tree with the given size and operation.
         
         Args:
             size: The size of the array
-            operation: The operation to perform (e.g., sum, min, max)
+            operation: The operation to perform (e.g., sum, min, max). Builtins such
+                       as operator.add, min and max are called without creating a
+                       Python frame, so prefer them over equivalent lambdas
             initial_values: Optional list of initial values
+            identity: Optional identity element of the operation (e.g. 0 for sum,
+                      float('inf') for min). Empty slots hold it and every combine
+                      calls operation directly. Without it empty slots are None
+                      and combines skip them.
         """
         self.size = size
         self.operation = operation
+        self.identity = identity
+        self._combine = operation if identity is not None else _skip_none(operation)
         
-        # Calculate tree size (next power of 2)
-        self.tree_size = 2 * (1 << (size - 1).bit_length()) - 1
-        self.tree = [None] * self.tree_size
+        # Leaves live at tree[n_leaves:2 * n_leaves], internal node i has
+        # children 2i and 2i + 1, and tree[1] is the root
+        self.n_leaves = 1 << (size - 1).bit_length() if size > 1 else 1
+        self.tree_size = 2 * self.n_leaves
+        self.tree = [identity] * self.tree_size
+        self._prefix = None
         
         if initial_values:
             if len(initial_values) != size:
                 raise ValueError("Initial values length must match size")
-            self._build(0, 0, size - 1, initial_values)
+            self._build(initial_values)
             
     def __str__(self) -> str:
         """
@@ -54,88 +88,94 @@ class SegmentTree:
         """
         return self.__str__()
         
-    def _build(self, node: int, start: int, end: int, values: List[Any]) -> None:
+    def _build(self, values: List[Any]) -> None:
         """
-        Build the segment tree recursively.
+        Build the segment tree bottom-up from the leaves.
         
         Args:
-            node: The current node index
-            start: The start index of the segment
-            end: The end index of the segment
             values: The array of values
         """
-        if start == end:
-            self.tree[node] = values[start]
-            return
+        tree = self.tree
+        op = self._combine
+        start = self.n_leaves
+        count = self.size
+        tree[start:start + count] = values
+        
+        # Build one level at a time: map() combines every complete pair of
+        # children in a single C-level loop, and a trailing unpaired child is
+        # copied up as-is since its sibling is empty. The builtin min and max
+        # are inlined as comparisons, which skips their generic call path
+        while start > 1:
+            pairs = count // 2
+            parent = start // 2
+            lefts = tree[start:start + 2 * pairs:2]
+            rights = tree[start + 1:start + 2 * pairs:2]
+            if op is min:
+                tree[parent:parent + pairs] = [b if b < a else a for a, b in zip(lefts, rights)]
+            elif op is max:
+                tree[parent:parent + pairs] = [b if b > a else a for a, b in zip(lefts, rights)]
+            else:
+                tree[parent:parent + pairs] = map(op, lefts, rights)
+            if count & 1:
+                tree[parent + pairs] = tree[start + count - 1]
+            start = parent
+            count = pairs + (count & 1)
             
-        mid = (start + end) // 2
-        left_child = 2 * node + 1
-        right_child = 2 * node + 2
-        
-        self._build(left_child, start, mid, values)
-        self._build(right_child, mid + 1, end, values)
-        
-        self.tree[node] = self.operation(self.tree[left_child], self.tree[right_child])
-        
-    def _update(self, node: int, start: int, end: int, index: int, value: Any) -> None:
+        # Integer sums are also kept as prefix sums, so queries are O(1) until
+        # the first update. The check comes first: floats are excluded since
+        # differences of large prefixes lose precision, and accumulating str,
+        # list or tuple payloads would copy every prefix
+        if self.operation is operator.add and all(type(v) is int for v in values):
+            prefix = [0]
+            prefix.extend(accumulate(values))
+            self._prefix = prefix
+            
+    def _update(self, index: int, value: Any) -> None:
         """
-        Update a single element recursively.
+        Set a leaf and recompute its ancestors.
         
         Args:
-            node: The current node index
-            start: The start index of the segment
-            end: The end index of the segment
             index: The index to update
             value: The new value
         """
-        if start == end:
-            self.tree[node] = value
-            return
-            
-        mid = (start + end) // 2
-        left_child = 2 * node + 1
-        right_child = 2 * node + 2
-        
-        if index <= mid:
-            self._update(left_child, start, mid, index, value)
-        else:
-            self._update(right_child, mid + 1, end, index, value)
+        tree = self.tree
+        op = self._combine
+        i = index + self.n_leaves
+        tree[i] = value
+        i //= 2
+        
+        while i:
+            tree[i] = op(tree[2 * i], tree[2 * i + 1])
+            i //= 2
             
-        self.tree[node] = self.operation(self.tree[left_child], self.tree[right_child])
-        
-    def _query(self, node: int, start: int, end: int, left: int, right: int) -> Any:
+    def _query(self, left: int, right: int) -> Any:
         """
-        Query a range recursively.
+        Query a range by walking both ends of it up towards the root.
         
         Args:
-            node: The current node index
-            start: The start index of the segment
-            end: The end index of the segment
             left: The left index of the query range
             right: The right index of the query range
             
         Returns:
             The result of the operation on the range
         """
-        if right < start or left > end:
-            return None
+        tree = self.tree
+        op = self._combine
+        left += self.n_leaves
+        right += self.n_leaves + 1
+        res_left = res_right = self.identity
+        
+        while left < right:
+            if left & 1:
+                res_left = op(res_left, tree[left])
+                left += 1
+            if right & 1:
+                right -= 1
+                res_right = op(tree[right], res_right)
+            left //= 2
+            right //= 2
             
-        if left <= start and right >= end:
-            return self.tree[node]
-            
-        mid = (start + end) // 2
-        left_child = 2 * node + 1
-        right_child = 2 * node + 2
-        
-        left_result = self._query(left_child, start, mid, left, right)
-        right_result = self._query(right_child, mid + 1, end, left, right)
-        
-        if left_result is None:
-            return right_result
-        if right_result is None:
-            return left_result
-            
-        return self.operation(left_result, right_result)
+        return op(res_left, res_right)
         
     def update(self, index: int, value: Any) -> None:
         """
@@ -148,7 +188,8 @@ class SegmentTree:
         if not 0 <= index < self.size:
             raise IndexError("Index out of range")
             
-        self._update(0, 0, self.size - 1, index, value)
+        self._prefix = None
+        self._update(index, value)
         
     def query(self, start: int, end: int) -> Any:
         """
@@ -164,7 +205,10 @@ class SegmentTree:
         if not 0 <= start <= end < self.size:
             raise IndexError("Index out of range")
             
-        return self._query(0, 0, self.size - 1, start, end)
+        if self._prefix is not None:
+            return self._prefix[end + 1] - self._prefix[start]
+            
+        return self._query(start, end)
         
     def get(self, index: int) -> Any:
         """
@@ -176,9 +220,6 @@ class SegmentTree:
         Returns:
             The value at the index
         """
-        if not 0 <= index < self.size:
-            raise IndexError("Index out of range")
-            
         return self.query(index, index)
         
     def set(self, index: int, value: Any) -> None:
@@ -189,24 +230,285 @@ class SegmentTree:
             index: The index to set the value at (0-based)
             value: The value to set
         """
-        if not 0 <= index < self.size:
-            raise IndexError("Index out of range")
-            
         self.update(index, value)
         
     def clear(self) -> None:
         """
         Clear all values in the tree.
         """
-        self.tree = [None] * self.tree_size
+        self.tree = [self.identity] * self.tree_size
+        self._prefix = None
+
+
+class IntSegmentTree(SegmentTree):
+    """
+    A Segment Tree specialized for 64-bit signed integers.
+    
+    Nodes are stored unboxed in a flat buffer of C int64s, so the tree takes
+    8 bytes per node instead of a pointer plus a boxed int. The operation must
+    map int64 values to int64 values (e.g. operator.add, min, max, operator.xor)
+    and an integer identity is required, so no None checks are needed.
+    
+    The buffer is a memoryview cast to 'q' rather than an array.array, since this
+    package's own array module shadows the standard library one when the files
+    are run directly.
+    """
+    def __init__(self, size: int, operation: Callable[[int, int], int], initial_values: Optional[List[int]] = None,
+                 identity: int = 0):
+        """
+        Initialize an integer Segment Tree.
+        
+        Args:
+            size: The size of the array
+            operation: The operation to perform (e.g., sum, min, max)
+            initial_values: Optional list of initial values
+            identity: The identity element of the operation (default: 0)
+            
+        Raises:
+            TypeError: if identity is not an int
+            ValueError: if a value does not fit in 64 bits
+        """
+        if not isinstance(identity, int):
+            raise TypeError("IntSegmentTree requires an integer identity")
+        super().__init__(size, operation, None, identity)
+        self.tree = self._pack(self.tree)
+        
+        if initial_values:
+            if len(initial_values) != size:
+                raise ValueError("Initial values length must match size")
+            self._build(initial_values)
+            
+    def __str__(self) -> str:
+        """
+        Return the string representation of the integer Segment Tree.
+        """
+        return f"IntSegmentTree(size={self.size}, operation={self.operation.__name__})"
+        
+    @staticmethod
+    def _pack(values: List[int]) -> memoryview:
+        """
+        Copy a list of ints into a new int64 buffer.
+        
+        Args:
+            values: The values to copy
+            
+        Returns:
+            A memoryview of C int64s
+            
+        Raises:
+            ValueError: if a value is not an int or does not fit in 64 bits
+        """
+        try:
+            packed = struct.pack(f"{len(values)}q", *values)
+        except struct.error as e:
+            raise ValueError(f"values must be 64-bit signed integers: {e}") from None
+        return memoryview(bytearray(packed)).cast('q')
+        
+    def _build(self, values: List[int]) -> None:
+        """
+        Build the tree in a list, then copy it into the int64 buffer.
+        
+        Args:
+            values: The array of values
+        """
+        self.tree = [self.identity] * self.tree_size
+        super()._build(values)
+        self.tree = self._pack(self.tree)
+        if self._prefix is not None:
+            try:
+                self._prefix = self._pack(self._prefix)
+            except ValueError:
+                # A running sum left int64 even though every node fits
+                self._prefix = None
+        
+    def clear(self) -> None:
+        """
+        Clear all values in the tree.
+        """
+        self.tree = self._pack([self.identity] * self.tree_size)
+        self._prefix = None
+
+
+class LazySegmentTree(SegmentTree):
+    """
+    A Segment Tree with lazy propagation, supporting range updates in O(log n).
+    
+    Range updates are described by two functions besides the range operation:
+    - mapping(update, value, length) returns the aggregate of a segment of the
+      given length after the update is applied to every element in it
+    - composition(new, old) returns a single update equivalent to applying
+      old and then new
+    For example, range add over range sum uses
+    mapping=lambda u, v, n: v + u * n and composition=operator.add.
+    
+    Pending updates are stored per internal node and pushed down to the
+    children only when a later operation has to look inside that node.
+    
+    An identity element is required: unset elements hold the identity, so a
+    range update reaches them like any other element instead of being lost.
+    
+    Methods:
+        - update_range(start, end, update) apply update to every element in [start, end]
+        - update(index, value) update a single element
+        - query(start, end) get result of operation on range [start, end]
+    """
+    def __init__(self, size: int, operation: Callable[[Any, Any], Any],
+                 mapping: Callable[[Any, Any, int], Any], composition: Callable[[Any, Any], Any],
+                 initial_values: Optional[List[Any]] = None, identity: Any = None):
+        """
+        Initialize a lazy Segment Tree.
+        
+        Args:
+            size: The size of the array
+            operation: The operation to perform (e.g., sum, min, max)
+            mapping: Applies an update to a segment aggregate of a given length
+            composition: Composes a new update with a pending one
+            initial_values: Optional list of initial values
+            identity: The identity element of the operation (e.g. 0 for sum,
+                float('inf') for min)
+                
+        Raises:
+            ValueError: if identity is None
+        """
+        if identity is None:
+            raise ValueError("LazySegmentTree requires an identity element")
+        self.mapping = mapping
+        self.composition = composition
+        super().__init__(size, operation, initial_values, identity)
+        self.lazy = [None] * self.n_leaves
+        self._log = self.n_leaves.bit_length() - 1
+        
+    def __str__(self) -> str:
+        """
+        Return the string representation of the lazy Segment Tree.
+        """
+        return f"LazySegmentTree(size={self.size}, operation={self.operation.__name__})"
+        
+    def _apply(self, node: int, update: Any, length: int) -> None:
+        """
+        Apply an update to a node and record it as pending for its children.
+        
+        Args:
+            node: The node index
+            update: The update to apply
+            length: The number of leaves under the node
+        """
+        self.tree[node] = self.mapping(update, self.tree[node], length)
+        if node < self.n_leaves:
+            pending = self.lazy[node]
+            self.lazy[node] = update if pending is None else self.composition(update, pending)
+            
+    def _push(self, node: int, length: int) -> None:
+        """
+        Push the pending update of a node down to its children.
+        
+        Args:
+            node: The node index
+            length: The number of leaves under the node
+        """
+        update = self.lazy[node]
+        if update is not None:
+            self._apply(2 * node, update, length // 2)
+            self._apply(2 * node + 1, update, length // 2)
+            self.lazy[node] = None
+            
+    def _push_bounds(self, left: int, right: int) -> None:
+        """
+        Push pending updates on the root paths of the leaf range [left, right).
+        
+        Args:
+            left: The first leaf position (inclusive)
+            right: The last leaf position (exclusive)
+        """
+        for h in range(self._log, 0, -1):
+            if (left >> h) << h != left:
+                self._push(left >> h, 1 << h)
+            if (right >> h) << h != right:
+                self._push((right - 1) >> h, 1 << h)
+                
+    def _update(self, index: int, value: Any) -> None:
+        """
+        Set a leaf and recompute its ancestors, after pushing pending updates.
+        
+        Args:
+            index: The index to update
+            value: The new value
+        """
+        node = index + self.n_leaves
+        for h in range(self._log, 0, -1):
+            self._push(node >> h, 1 << h)
+            
+        super()._update(index, value)
+        
+    def _query(self, left: int, right: int) -> Any:
+        """
+        Query a range, after pushing pending updates along its boundaries.
+        
+        Args:
+            left: The left index of the query range
+            right: The right index of the query range
+            
+        Returns:
+            The result of the operation on the range
+        """
+        self._push_bounds(left + self.n_leaves, right + self.n_leaves + 1)
+        return super()._query(left, right)
+        
+    def update_range(self, start: int, end: int, update: Any) -> None:
+        """
+        Apply an update to every element in the range [start, end].
+        
+        Args:
+            start: The start index (inclusive)
+            end: The end index (inclusive)
+            update: The update to apply
+        """
+        if not 0 <= start <= end < self.size:
+            raise IndexError("Index out of range")
+            
+        self._prefix = None
+        tree = self.tree
+        op = self._combine
+        left = start + self.n_leaves
+        right = end + self.n_leaves + 1
+        self._push_bounds(left, right)
+        
+        # Apply the update to the canonical cover of the range
+        l, r, length = left, right, 1
+        while l < r:
+            if l & 1:
+                self._apply(l, update, length)
+                l += 1
+            if r & 1:
+                r -= 1
+                self._apply(r, update, length)
+            l //= 2
+            r //= 2
+            length *= 2
+            
+        # Recompute the ancestors of the two boundary nodes
+        for h in range(1, self._log + 1):
+            if (left >> h) << h != left:
+                i = left >> h
+                tree[i] = op(tree[2 * i], tree[2 * i + 1])
+            if (right >> h) << h != right:
+                i = (right - 1) >> h
+                tree[i] = op(tree[2 * i], tree[2 * i + 1])
+                
+    def clear(self) -> None:
+        """
+        Clear all values and pending updates in the tree.
+        """
+        super().clear()
+        self.lazy = [None] * self.n_leaves
 
 
 class TestSegmentTree(unittest.TestCase):
     def setUp(self):
         # Create segment trees for different operations
-        self.sum_tree = SegmentTree(5, lambda x, y: x + y if x is not None and y is not None else x if x is not None else y)
-        self.min_tree = SegmentTree(5, lambda x, y: min(x, y) if x is not None and y is not None else x if x is not None else y)
-        self.max_tree = SegmentTree(5, lambda x, y: max(x, y) if x is not None and y is not None else x if x is not None else y)
+        self.sum_tree = SegmentTree(5, operator.add)
+        self.min_tree = SegmentTree(5, min)
+        self.max_tree = SegmentTree(5, max)
         
     def test_init(self):
         self.assertEqual(self.sum_tree.size, 5)
@@ -215,7 +517,7 @@ class TestSegmentTree(unittest.TestCase):
         
         # Test initialization with values
         values = [1, 2, 3, 4, 5]
-        st = SegmentTree(5, lambda x, y: x + y if x is not None and y is not None else x if x is not None else y, values)
+        st = SegmentTree(5, operator.add, values)
         self.assertEqual(st.query(0, 4), 15)
         
     def test_update(self):
@@ -345,7 +647,7 @@ class TestSegmentTree(unittest.TestCase):
             
     def test_complex_operations(self):
         # Create a larger tree
-        st = SegmentTree(10, lambda x, y: x + y if x is not None and y is not None else x if x is not None else y)
+        st = SegmentTree(10, operator.add)
         
         # Perform multiple updates
         for i in range(10):
@@ -371,16 +673,68 @@ class TestSegmentTree(unittest.TestCase):
         self.assertEqual(st.query(0, 7), 34)
         self.assertEqual(st.query(0, 9), 58)
         
+    def test_tree_size(self):
+        for size, n_leaves in [(0, 1), (1, 1), (2, 2), (5, 8), (8, 8), (9, 16)]:
+            st = SegmentTree(size, operator.add)
+            self.assertEqual(st.n_leaves, n_leaves)
+            self.assertEqual(st.tree_size, 2 * n_leaves)
+            
+        st = SegmentTree(1, operator.add, [7])
+        self.assertEqual(st.query(0, 0), 7)
+        st.update(0, 3)
+        self.assertEqual(st.get(0), 3)
+        
+    def test_static_sum_prefix(self):
+        values = [4, -2, 7, 0, 5, 3]
+        st = SegmentTree(6, operator.add, values)
+        self.assertIsNotNone(st._prefix)
+        for left in range(6):
+            for right in range(left, 6):
+                self.assertEqual(st.query(left, right), sum(values[left:right + 1]))
+                
+        st.update(2, 1)
+        self.assertIsNone(st._prefix)
+        self.assertEqual(st.query(0, 5), 11)
+        
+        self.assertIsNone(SegmentTree(3, operator.add, [0.5, 1, 2])._prefix)
+        self.assertIsNone(SegmentTree(3, operator.add, [1, 2, 0.5])._prefix)
+        
+        words = SegmentTree(3, operator.add, ["ab", "cd", "ef"])
+        self.assertIsNone(words._prefix)
+        self.assertEqual(words.query(0, 2), "abcdef")
+        self.assertEqual(words.query(1, 2), "cdef")
+        self.assertIsNone(SegmentTree(3, min, [1, 2, 3])._prefix)
+        
+    def test_identity(self):
+        values = [5, 3, 8, 1, 9, 2, 7]
+        sum_tree = SegmentTree(7, operator.add, values, identity=0)
+        min_tree = SegmentTree(7, min, values, identity=float('inf'))
+        
+        for left in range(7):
+            for right in range(left, 7):
+                self.assertEqual(sum_tree.query(left, right), sum(values[left:right + 1]))
+                self.assertEqual(min_tree.query(left, right), min(values[left:right + 1]))
+                
+        sum_tree.update(3, 10)
+        self.assertEqual(sum_tree.query(0, 6), 44)
+        
+        sum_tree.clear()
+        self.assertEqual(sum_tree.query(0, 6), 0)
+        self.assertEqual(sum_tree.get(2), 0)
+        
+        empty = SegmentTree(4, operator.add, identity=0)
+        self.assertEqual(empty.query(0, 3), 0)
+        
     def test_different_operations(self):
         # Test GCD operation
-        gcd_tree = SegmentTree(5, lambda x, y: self._gcd(x, y) if x is not None and y is not None else x if x is not None else y)
+        gcd_tree = SegmentTree(5, self._gcd)
         values = [12, 18, 24, 36, 48]
         for i, value in enumerate(values):
             gcd_tree.update(i, value)
         self.assertEqual(gcd_tree.query(0, 4), 6)
         
         # Test XOR operation
-        xor_tree = SegmentTree(5, lambda x, y: x ^ y if x is not None and y is not None else x if x is not None else y)
+        xor_tree = SegmentTree(5, operator.xor)
         values = [1, 2, 3, 4, 5]
         for i, value in enumerate(values):
             xor_tree.update(i, value)
@@ -395,5 +749,109 @@ class TestSegmentTree(unittest.TestCase):
         return a
 
 
+class TestIntSegmentTree(unittest.TestCase):
+    def test_operations(self):
+        values = [5, -3, 8, 1, 9, 2, 7]
+        sum_tree = IntSegmentTree(7, operator.add, values)
+        max_tree = IntSegmentTree(7, max, values, identity=-(1 << 63))
+        
+        for left in range(7):
+            for right in range(left, 7):
+                self.assertEqual(sum_tree.query(left, right), sum(values[left:right + 1]))
+                self.assertEqual(max_tree.query(left, right), max(values[left:right + 1]))
+                
+        sum_tree.update(1, 10)
+        max_tree.set(6, 20)
+        self.assertEqual(sum_tree.query(0, 6), 42)
+        self.assertEqual(max_tree.query(0, 6), 20)
+        self.assertEqual(sum_tree.get(1), 10)
+        
+        sum_tree.clear()
+        self.assertEqual(sum_tree.query(0, 6), 0)
+        
+    def test_memory_layout(self):
+        tree = IntSegmentTree(100, operator.add)
+        self.assertIsInstance(tree.tree, memoryview)
+        self.assertEqual(tree.tree.nbytes, 8 * tree.tree_size)
+        
+    def test_errors(self):
+        with self.assertRaises(TypeError):
+            IntSegmentTree(4, min, identity=float('inf'))
+        with self.assertRaises(ValueError):
+            IntSegmentTree(2, operator.add, [1 << 63, 0])
+        with self.assertRaises(ValueError):
+            IntSegmentTree(2, operator.add, [1.5, 0])
+        tree = IntSegmentTree(2, operator.add)
+        with self.assertRaises(TypeError):
+            tree.update(0, "x")
+
+
+class TestLazySegmentTree(unittest.TestCase):
+    def test_requires_identity(self):
+        with self.assertRaises(ValueError):
+            LazySegmentTree(4, min, lambda u, v, n: u, lambda new, old: new)
+            
+    def test_update_unset_elements(self):
+        tree = LazySegmentTree(4, min, lambda u, v, n: u, lambda new, old: new, identity=float('inf'))
+        tree.update_range(0, 3, 5)
+        self.assertEqual(tree.query(0, 3), 5)
+        self.assertEqual(tree.get(2), 5)
+        
+        tree = LazySegmentTree(4, operator.add, lambda u, v, n: v + u * n, operator.add, identity=0)
+        tree.update(0, 1)
+        tree.update(1, 2)
+        tree.update_range(0, 3, 10)
+        self.assertEqual(tree.query(0, 3), 43)
+        self.assertEqual([tree.get(i) for i in range(4)], [11, 12, 10, 10])
+        self.assertEqual(tree.query(0, 3), sum(tree.get(i) for i in range(4)))
+        
+    def test_range_add_sum(self):
+        values = [3, 1, 4, 1, 5, 9, 2]
+        tree = LazySegmentTree(7, operator.add, lambda u, v, n: v + u * n, operator.add, values, identity=0)
+        
+        tree.update_range(1, 4, 10)
+        values[1:5] = [v + 10 for v in values[1:5]]
+        self.assertEqual(tree.query(0, 6), sum(values))
+        self.assertEqual(tree.query(2, 3), sum(values[2:4]))
+        self.assertEqual(tree.get(4), values[4])
+        
+        tree.update(3, 0)
+        values[3] = 0
+        tree.update_range(0, 6, -1)
+        values = [v - 1 for v in values]
+        for left in range(7):
+            for right in range(left, 7):
+                self.assertEqual(tree.query(left, right), sum(values[left:right + 1]))
+                
+    def test_range_assign_min(self):
+        values = [8, 6, 7, 5, 3, 0, 9, 4, 2]
+        tree = LazySegmentTree(9, min, lambda u, v, n: u, lambda new, old: new, values, identity=float('inf'))
+        
+        tree.update_range(2, 6, 5)
+        values[2:7] = [5] * 5
+        tree.update_range(4, 8, 7)
+        values[4:9] = [7] * 5
+        for left in range(9):
+            for right in range(left, 9):
+                self.assertEqual(tree.query(left, right), min(values[left:right + 1]))
+                
+    def test_clear(self):
+        tree = LazySegmentTree(4, operator.add, lambda u, v, n: v + u * n, operator.add, [1, 2, 3, 4], identity=0)
+        tree.update_range(0, 3, 5)
+        tree.clear()
+        self.assertEqual(tree.query(0, 3), 0)
+        tree.update(1, 2)
+        self.assertEqual(tree.query(0, 3), 2)
+        
+    def test_error_handling(self):
+        tree = LazySegmentTree(4, operator.add, lambda u, v, n: v + u * n, operator.add, identity=0)
+        with self.assertRaises(IndexError):
+            tree.update_range(-1, 2, 1)
+        with self.assertRaises(IndexError):
+            tree.update_range(2, 4, 1)
+        with self.assertRaises(IndexError):
+            tree.update_range(3, 2, 1)
+
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -7,14 +7,20 @@ class Node:
     Attributes:
         value: The value stored in the node
         next: Reference to the next node
+        prev: Reference to the previous node, kept so that pop and removals
+              near the tail do not have to walk from the head
     """
+    __slots__ = ("value", "next", "prev")
+    
     def __init__(self, value):
         self.value = value
         self.next = None
+        self.prev = None
 
 class SinglyLinkedList:
     """
     SinglyLinkedList is a data structure where each element points to the next.
+    Nodes also keep a back link internally, which makes pop O(1).
     
     Methods:
         - append(value) append value to the end of the list
@@ -31,17 +37,18 @@ class SinglyLinkedList:
         self.head = None
         self.tail = None
         self.length = 0
+        
+        # Every mutation bumps _version; the list of values built by a full
+        # walk is reused until the version changes
+        self._version = 0
+        self._cache_version = -1
+        self._cache = None
 
     def __str__(self) -> str:
         """
         Return the string representation of the list.
         """
-        values = []
-        current = self.head
-        while current:
-            values.append(str(current.value))
-            current = current.next
-        return f"[{', '.join(values)}]"
+        return f"[{', '.join(map(str, self._values()))}]"
 
     def __repr__(self) -> str:
         """
@@ -62,9 +69,14 @@ class SinglyLinkedList:
         Args:
             value: the value to check
         """
+        if self._cache_version == self._version:
+            return value in self._cache
+            
+        # Same identity-then-equality test as list.__contains__
         current = self.head
-        while current:
-            if current.value == value:
+        while current is not None:
+            item = current.value
+            if item is value or item == value:
                 return True
             current = current.next
         return False
@@ -74,17 +86,28 @@ class SinglyLinkedList:
         Return the value at the specified index.
         
         Args:
-            index: the index of the value to return
+            index: the index of the value to return (negative counts from the end)
             
         Raises:
             IndexError: if the index is out of range
         """
+        if index < 0:
+            index += self.length
         if index >= self.length or index < 0:
             raise IndexError("Index out of range")
+            
+        if index == self.length - 1:
+            return self.tail.value
         
-        current = self.head
-        for i in range(index):
-            current = current.next
+        # Walk from whichever end is closer
+        if index < self.length // 2:
+            current = self.head
+            for _ in range(index):
+                current = current.next
+        else:
+            current = self.tail
+            for _ in range(self.length - 1 - index):
+                current = current.prev
         return current.value
 
     def append(self, value) -> None:
@@ -100,10 +123,12 @@ class SinglyLinkedList:
             self.head = new_node
             self.tail = new_node
         else:
+            new_node.prev = self.tail
             self.tail.next = new_node
             self.tail = new_node
             
         self.length += 1
+        self._version += 1
     
     def prepend(self, value) -> None:
         """
@@ -119,9 +144,11 @@ class SinglyLinkedList:
             self.tail = new_node
         else:
             new_node.next = self.head
+            self.head.prev = new_node
             self.head = new_node
             
         self.length += 1
+        self._version += 1
 
     def pop(self):
         """
@@ -136,21 +163,20 @@ class SinglyLinkedList:
         if not self.head:
             raise IndexError("Cannot pop from an empty list")
             
-        if self.head == self.tail:
+        if self.head is self.tail:
             value = self.head.value
             self.head = None
             self.tail = None
             self.length = 0
+            self._version += 1
             return value
             
-        current = self.head
-        while current.next != self.tail:
-            current = current.next
-            
         value = self.tail.value
+        current = self.tail.prev
         current.next = None
         self.tail = current
         self.length -= 1
+        self._version += 1
         return value
     
     def remove(self, index) -> None:
@@ -158,31 +184,50 @@ class SinglyLinkedList:
         Remove the element at the specified index.
         
         Args:
-            index: the index of the element to remove
+            index: the index of the element to remove (negative counts from the end)
             
         Raises:
             IndexError: if the index is out of range
         """
+        if index < 0:
+            index += self.length
         if index >= self.length or index < 0:
             raise IndexError("Index out of range")
             
+        if index == self.length - 1:
+            self.pop()
+            return
+            
         if index == 0:
             self.head = self.head.next
             if not self.head:
                 self.tail = None
+            else:
+                self.head.prev = None
             self.length -= 1
+            self._version += 1
             return
             
-        current = self.head
-        for i in range(index - 1):
-            current = current.next
+        # Find the predecessor, walking from whichever end is closer
+        if index - 1 < self.length // 2:
+            current = self.head
+            for _ in range(index - 1):
+                current = current.next
+        else:
+            current = self.tail
+            for _ in range(self.length - index):
+                current = current.prev
             
         # If removing the last element, update tail
-        if current.next == self.tail:
+        removed = current.next
+        if removed is self.tail:
             self.tail = current
+        else:
+            removed.next.prev = current
             
-        current.next = current.next.next
+        current.next = removed.next
         self.length -= 1
+        self._version += 1
 
     def traverse(self):
         """
@@ -191,12 +236,26 @@ class SinglyLinkedList:
         Returns:
             A list containing all values
         """
-        values = []
-        current = self.head
-        while current:
-            values.append(current.value)
-            current = current.next
-        return values
+        return self._values()[:]
+        
+    def _values(self):
+        """
+        Return the cached list of values, walking the nodes only if the list
+        changed since the last walk. Callers must not modify the result.
+        
+        Returns:
+            A list containing all values
+        """
+        if self._cache_version != self._version:
+            values = []
+            append = values.append
+            current = self.head
+            while current:
+                append(current.value)
+                current = current.next
+            self._cache = values
+            self._cache_version = self._version
+        return self._cache
 
     def lookup(self, index):
         """
@@ -270,6 +329,24 @@ class TestSinglyLinkedList(unittest.TestCase):
         with self.assertRaises(IndexError):
             self.list.remove(5)
 
+    def test_prev_links(self):
+        for i in range(6):
+            self.list.append(i)
+        self.list.prepend(-1)
+        self.list.remove(5)
+        self.list.remove(1)
+        self.list.remove(0)
+        self.assertEqual(self.list.pop(), 5)
+        self.assertEqual(self.list.traverse(), [1, 2, 3])
+        
+        values = []
+        current = self.list.tail
+        while current:
+            values.append(current.value)
+            current = current.prev
+        self.assertEqual(values, [3, 2, 1])
+        self.assertIsNone(self.list.head.prev)
+        
     def test_traverse(self):
         self.assertEqual(self.list.traverse(), [])
         
@@ -298,6 +375,23 @@ class TestSinglyLinkedList(unittest.TestCase):
         self.assertFalse(2 in self.list)
         self.assertTrue(1 in self.list)
         
+    def test_traversal_cache(self):
+        self.list.append(1)
+        self.list.append(2)
+        values = self.list.traverse()
+        values.append(99)
+        self.assertEqual(self.list.traverse(), [1, 2])
+        self.assertTrue(2 in self.list)
+        
+        self.list.prepend(0)
+        self.assertEqual(self.list.traverse(), [0, 1, 2])
+        self.list.remove(1)
+        self.assertFalse(1 in self.list)
+        self.assertEqual(str(self.list), "[0, 2]")
+        self.list.pop()
+        self.assertEqual(self.list.traverse(), [0])
+        self.assertFalse(2 in self.list)
+        
     def test_getitem(self):
         self.list.append(10)
         self.list.append(20)
@@ -307,6 +401,22 @@ class TestSinglyLinkedList(unittest.TestCase):
         
         with self.assertRaises(IndexError):
             self.list[2]
+            
+    def test_negative_index(self):
+        for i in range(4):
+            self.list.append(i)
+            
+        self.assertEqual(self.list[-1], 3)
+        self.assertEqual(self.list[-4], 0)
+        with self.assertRaises(IndexError):
+            self.list[-5]
+            
+        self.list.remove(-1)
+        self.assertEqual(self.list.tail.value, 2)
+        self.list.remove(-3)
+        self.assertEqual(self.list.traverse(), [1, 2])
+        with self.assertRaises(IndexError):
+            self.list.remove(-3)
 
 if __name__ == '__main__':
     unittest.main()
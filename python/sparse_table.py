@@ -1,6 +1,6 @@
+import operator
 import unittest
-import math
-from typing import List, Callable, TypeVar, Generic, Optional, Union, Tuple
+from typing import List, Callable, TypeVar, Generic, Optional, Sequence, Union, Tuple
 
 T = TypeVar('T')
 
@@ -15,28 +15,38 @@ class SparseTable(Generic[T]):
         - query(left, right) perform a query on the range [left, right]
         - query_idempotent(left, right) perform a query using O(1) method for idempotent operations
         - query_non_idempotent(left, right) perform a query using O(log n) method for non-idempotent operations
+        - query_batch(lefts, rights) perform many queries in one call
     """
-    def __init__(self, array: List[T], operation: Callable[[T, T], T], idempotent: bool = True):
+    def __init__(self, array: Sequence[T], operation: Callable[[T, T], T], idempotent: bool = True,
+                 copy: bool = True):
         """
         Initialize a sparse table with the given array and operation.
         
         Args:
-            array: The input array
+            array: The input array (any sequence supporting len and slicing)
             operation: The binary function to use for range queries (e.g., min, max, gcd)
             idempotent: Whether the operation is idempotent (e.g., min, max, gcd)
                         If True, uses O(1) query method; if False, uses O(log n) query method
+            copy: Whether to copy the input. With copy=False the array is used as
+                  the table's base row directly, and the caller must not mutate it
+                  afterwards. Tuples are immutable and never need copying
         """
-        self.array = array.copy()
+        self.array = list(array) if copy and not isinstance(array, tuple) else array
         self.operation = operation
         self.idempotent = idempotent
         self.n = len(array)
         
         # Calculate log2(n) to determine table height
         if self.n > 0:
-            self.log_n = math.floor(math.log2(self.n)) + 1
+            self.log_n = self.n.bit_length()
         else:
             self.log_n = 1
             
+        # _log[length] is floor(log2(length)), so queries never touch floats
+        self._log = [0] * (self.n + 1)
+        for i in range(2, self.n + 1):
+            self._log[i] = self._log[i // 2] + 1
+            
         # Initialize sparse table
         self.table = self._build_table()
         
@@ -63,17 +73,17 @@ class SparseTable(Generic[T]):
         Build the sparse table.
         
         Returns:
-            A 2D array representing the sparse table
+            A ragged 2D array where row k holds the n - 2^k + 1 intervals of
+            length 2^k that fit in the array
         """
         if self.n == 0:
             return [[]]
             
-        # Initialize table with dimensions [log_n][n]
-        table = [[None for _ in range(self.n)] for _ in range(self.log_n)]
+        table = [None] * self.log_n
         
-        # Base case: The interval of length 1 is just the array itself
-        for i in range(self.n):
-            table[0][i] = self.array[i]
+        # Base case: The interval of length 1 is just the array itself. It is
+        # only ever read, so the row shares self.array instead of copying it
+        table[0] = self.array
             
         # Fill the rest of the table using dynamic programming
         for k in range(1, self.log_n):
@@ -81,13 +91,21 @@ class SparseTable(Generic[T]):
             length = 1 << k
             # Previous length
             prev_length = 1 << (k-1)
+            count = self.n - length + 1
+            prev = table[k-1]
+            
+            first = prev[:count]
+            second = prev[prev_length:prev_length + count]
             
-            for i in range(self.n - length + 1):
-                # Combine two intervals of length 2^(k-1)
-                table[k][i] = self.operation(
-                    table[k-1][i],
-                    table[k-1][i + prev_length]
-                )
+            # Combine two intervals of length 2^(k-1). The builtin min and max
+            # are inlined as comparisons, which avoids their generic argument
+            # handling; other operations go through map() in one C-level loop
+            if self.operation is min:
+                table[k] = [y if y < x else x for x, y in zip(first, second)]
+            elif self.operation is max:
+                table[k] = [y if y > x else x for x, y in zip(first, second)]
+            else:
+                table[k] = list(map(self.operation, first, second))
                 
         return table
                 
@@ -110,9 +128,9 @@ class SparseTable(Generic[T]):
         self._validate_range(left, right)
         
         if self.idempotent:
-            return self.query_idempotent(left, right)
+            return self._query_idempotent_unchecked(left, right)
         else:
-            return self.query_non_idempotent(left, right)
+            return self._query_non_idempotent_unchecked(left, right)
             
     def query_idempotent(self, left: int, right: int) -> T:
         """
@@ -130,23 +148,35 @@ class SparseTable(Generic[T]):
             ValueError: If the array is empty
         """
         self._validate_range(left, right)
+        return self._query_idempotent_unchecked(left, right)
         
+    def _query_idempotent_unchecked(self, left: int, right: int) -> T:
+        """
+        O(1) idempotent query on a range that has already been validated.
+        
+        Args:
+            left: The start index (inclusive)
+            right: The end index (inclusive)
+            
+        Returns:
+            The result of the operation on the range
+        """
         # Special case: single element
         if left == right:
             return self.array[left]
             
-        # Length of the range
-        length = right - left + 1
-        # Largest power of 2 <= length
-        k = math.floor(math.log2(length))
+        # Special case: the top row covers the whole array when n is a power of 2
+        if left == 0 and right == self.n - 1 and self.n & (self.n - 1) == 0:
+            return self.table[self.log_n - 1][0]
+            
+        # Largest power of 2 <= length of the range
+        k = self._log[right - left + 1]
         
         # For idempotent operations, we can overlap the intervals
         # First interval: [left, left + 2^k - 1]
         # Second interval: [right - 2^k + 1, right]
-        return self.operation(
-            self.table[k][left],
-            self.table[k][right - (1 << k) + 1]
-        )
+        row = self.table[k]
+        return self.operation(row[left], row[right - (1 << k) + 1])
         
     def query_non_idempotent(self, left: int, right: int) -> T:
         """
@@ -164,20 +194,29 @@ class SparseTable(Generic[T]):
             ValueError: If the array is empty
         """
         self._validate_range(left, right)
+        return self._query_non_idempotent_unchecked(left, right)
+        
+    def _query_non_idempotent_unchecked(self, left: int, right: int) -> T:
+        """
+        O(log n) non-idempotent query on a range that has already been validated.
         
+        Args:
+            left: The start index (inclusive)
+            right: The end index (inclusive)
+            
+        Returns:
+            The result of the operation on the range
+        """
         # Special case: single element
         if left == right:
             return self.array[left]
             
         # We need to divide the range into non-overlapping powers of 2
         result = None
-        p = 0  # Current power of 2
         
         while left <= right:
-            # Find largest k such that 2^k <= (right - left + 1)
-            k = 0
-            while (1 << (k + 1)) <= (right - left + 1):
-                k += 1
+            # Largest k such that 2^k <= (right - left + 1)
+            k = (right - left + 1).bit_length() - 1
                 
             # Apply operation with the current interval
             interval_value = self.table[k][left]
@@ -191,6 +230,50 @@ class SparseTable(Generic[T]):
             
         return result
     
+    def query_batch(self, lefts: List[int], rights: List[int]) -> List[T]:
+        """
+        Perform many range queries in one call.
+        
+        Attribute lookups are done once for the whole batch rather than once
+        per query, which matters when thousands of queries are issued.
+        
+        Args:
+            lefts: The start indices (inclusive)
+            rights: The end indices (inclusive)
+            
+        Returns:
+            A list with the result for each [lefts[i], rights[i]] range
+            
+        Raises:
+            IndexError: If any range is invalid
+            ValueError: If the array is empty or the index lists differ in length
+        """
+        if len(lefts) != len(rights):
+            raise ValueError("lefts and rights must have the same length")
+            
+        validate = self._validate_range
+        if not self.idempotent:
+            query = self._query_non_idempotent_unchecked
+            results = []
+            for left, right in zip(lefts, rights):
+                validate(left, right)
+                results.append(query(left, right))
+            return results
+            
+        table = self.table
+        log = self._log
+        op = self.operation
+        results = []
+        append = results.append
+        
+        for left, right in zip(lefts, rights):
+            validate(left, right)
+            k = log[right - left + 1]
+            row = table[k]
+            append(op(row[left], row[right - (1 << k) + 1]))
+            
+        return results
+    
     def _validate_range(self, left: int, right: int) -> None:
         """
         Validate that the query range is valid.
@@ -220,7 +303,7 @@ class TestSparseTable(unittest.TestCase):
         self.max_table = SparseTable(self.max_array, max, idempotent=True)
         
         self.sum_array = [5, 2, 8, 1, 9, 3, 7, 4, 6]
-        self.sum_table = SparseTable(self.sum_array, lambda x, y: x + y, idempotent=False)
+        self.sum_table = SparseTable(self.sum_array, operator.add, idempotent=False)
         
         # GCD function for testing
         def gcd(a, b):
@@ -239,11 +322,21 @@ class TestSparseTable(unittest.TestCase):
         self.assertEqual(self.min_table.n, 9)
         self.assertEqual(self.min_table.log_n, 4)  # log2(9) = 3.17, floor + 1 = 4
         self.assertEqual(len(self.min_table.table), 4)
+        self.assertEqual([len(row) for row in self.min_table.table], [9, 8, 6, 2])
         
         # Test empty table
         self.assertEqual(len(self.empty_table), 0)
         self.assertEqual(self.empty_table.log_n, 1)
         
+    def test_log_table(self):
+        table = SparseTable(list(range(1025)), min)
+        for length in range(1, 1026):
+            self.assertEqual(table._log[length], length.bit_length() - 1)
+        self.assertEqual(table.log_n, 11)
+        self.assertEqual(table.query(0, 1023), 0)
+        self.assertEqual(SparseTable(list(range(1024, 0, -1)), min).query(0, 1023), 1)
+        self.assertEqual(table.query(1, 1024), 1)
+        
     def test_min_query(self):
         # Test various ranges
         self.assertEqual(self.min_table.query(0, 8), 1)  # Entire array
@@ -306,6 +399,33 @@ class TestSparseTable(unittest.TestCase):
         self.assertEqual(self.gcd_table.query(0, 1), 6)   # GCD of [12, 6]
         self.assertEqual(self.gcd_table.query(2, 3), 8)   # GCD of [8, 24]
         
+    def test_copy(self):
+        array = [4, 2, 7, 1]
+        copied = SparseTable(array, min)
+        array[3] = 9
+        self.assertEqual(copied.query(0, 3), 1)
+        
+        shared = SparseTable(array, min, copy=False)
+        self.assertIs(shared.array, array)
+        self.assertEqual(shared.query(0, 3), 2)
+        
+        values = (5, 3, 8, 6)
+        from_tuple = SparseTable(values, max)
+        self.assertIs(from_tuple.array, values)
+        self.assertEqual(from_tuple.query(1, 3), 8)
+        
+    def test_query_batch(self):
+        lefts = [0, 0, 3, 6, 4]
+        rights = [8, 2, 5, 8, 4]
+        self.assertEqual(self.min_table.query_batch(lefts, rights), [1, 2, 1, 4, 9])
+        self.assertEqual(self.sum_table.query_batch(lefts, rights), [45, 15, 13, 17, 9])
+        self.assertEqual(self.min_table.query_batch([], []), [])
+        
+        with self.assertRaises(IndexError):
+            self.min_table.query_batch([0, 3], [2, 9])
+        with self.assertRaises(ValueError):
+            self.min_table.query_batch([0, 1], [2])
+            
     def test_idempotent_vs_non_idempotent(self):
         # Create a custom operation for testing
         def op(x, y):
@@ -334,7 +454,7 @@ class TestSparseTable(unittest.TestCase):
         large_array = list(range(1000))
         min_table = SparseTable(large_array, min)
         max_table = SparseTable(large_array, max)
-        sum_table = SparseTable(large_array, lambda x, y: x + y, idempotent=False)
+        sum_table = SparseTable(large_array, operator.add, idempotent=False)
         
         # Test min
         self.assertEqual(min_table.query(50, 150), 50)
@@ -1,4 +1,5 @@
 import unittest
+from collections import Counter
 
 class Stack:
     """
@@ -9,11 +10,20 @@ class Stack:
         - pop() remove and return the top element
         - peek() return the top element without removing it
     """
-    def __init__(self):
+    def __init__(self, track_membership: bool = False):
         """
         Initialize an empty stack.
+        
+        Args:
+            track_membership: keep a count of every stacked value so that `in`
+                              checks are O(1); unhashable values are not
+                              counted and fall back to a linear scan
+                              (default: False)
         """
         self.items = []
+        self._membership = Counter() if track_membership else None
+        # Number of stacked values the Counter could not hash
+        self._unhashable = 0
         
     def __str__(self) -> str:
         """
@@ -40,6 +50,15 @@ class Stack:
         Args:
             value: the value to check
         """
+        if self._membership is not None:
+            try:
+                if self._membership[value] > 0:
+                    return True
+            except TypeError:
+                return value in self.items
+            # An unhashable value on the stack may still compare equal
+            if not self._unhashable:
+                return False
         return value in self.items
         
     def push(self, value) -> None:
@@ -49,6 +68,11 @@ class Stack:
         Args:
             value: the value to add
         """
+        if self._membership is not None:
+            try:
+                self._membership[value] += 1
+            except TypeError:
+                self._unhashable += 1
         self.items.append(value)
         
     def pop(self):
@@ -61,9 +85,134 @@ class Stack:
         Raises:
             IndexError: if the stack is empty
         """
-        if len(self.items) == 0:
+        try:
+            value = self.items.pop()
+        except IndexError:
+            raise IndexError("Cannot pop from an empty stack") from None
+        if self._membership is not None:
+            try:
+                self._membership[value] -= 1
+            except TypeError:
+                self._unhashable -= 1
+            else:
+                if not self._membership[value]:
+                    del self._membership[value]
+        return value
+        
+    def peek(self):
+        """
+        Return the top element without removing it.
+        
+        Returns:
+            The top element
+            
+        Raises:
+            IndexError: if the stack is empty
+        """
+        try:
+            return self.items[-1]
+        except IndexError:
+            raise IndexError("Cannot peek at an empty stack") from None
+        
+    def is_empty(self) -> bool:
+        """
+        Check if the stack is empty.
+        
+        Returns:
+            True if the stack is empty, False otherwise
+        """
+        return not self.items
+
+
+class IntStack:
+    """
+    A LIFO stack specialized for 64-bit signed integers.
+    
+    Values are stored unboxed in a preallocated buffer of C int64s that grows
+    geometrically, so the stack takes 8 bytes per element instead of a pointer
+    plus a boxed int.
+    
+    The buffer is a memoryview cast to 'q' rather than an array.array, since this
+    package's own array module shadows the standard library one when the files
+    are run directly.
+    
+    It has the same methods as Stack but is not a subclass: membership checks
+    always scan the buffer, so there is no track_membership option.
+    
+    Methods:
+        - push(value) add value to the top of the stack
+        - pop() remove and return the top element
+        - peek() return the top element without removing it
+    """
+    def __init__(self, capacity: int = 16):
+        """
+        Initialize an empty integer stack.
+        
+        Args:
+            capacity: the number of elements to preallocate room for (default: 16)
+        """
+        self.items = memoryview(bytearray(8 * max(capacity, 1))).cast('q')
+        self._n = 0
+        
+    def __str__(self) -> str:
+        """
+        Return the string representation of the stack.
+        """
+        return f"{self.items[:self._n].tolist()}"
+        
+    def __repr__(self) -> str:
+        """
+        Return the string representation of the stack.
+        """
+        return f"IntStack({self.items[:self._n].tolist()})"
+        
+    def __len__(self) -> int:
+        """
+        Return the length of the stack.
+        """
+        return self._n
+        
+    def __contains__(self, value) -> bool:
+        """
+        Check if the value is in the stack.
+        
+        Args:
+            value: the value to check
+        """
+        return value in self.items[:self._n].tolist()
+        
+    def push(self, value) -> None:
+        """
+        Add value to the top of the stack.
+        
+        Args:
+            value: the value to add
+            
+        Raises:
+            TypeError: if the value is not an integer
+            ValueError: if the value does not fit in a signed 64-bit integer
+        """
+        if self._n == len(self.items):
+            grown = memoryview(bytearray(16 * self._n)).cast('q')
+            grown[:self._n] = self.items
+            self.items = grown
+        self.items[self._n] = value
+        self._n += 1
+        
+    def pop(self):
+        """
+        Remove and return the top element.
+        
+        Returns:
+            The top element
+            
+        Raises:
+            IndexError: if the stack is empty
+        """
+        if self._n == 0:
             raise IndexError("Cannot pop from an empty stack")
-        return self.items.pop()
+        self._n -= 1
+        return self.items[self._n]
         
     def peek(self):
         """
@@ -75,9 +224,9 @@ class Stack:
         Raises:
             IndexError: if the stack is empty
         """
-        if len(self.items) == 0:
+        if self._n == 0:
             raise IndexError("Cannot peek at an empty stack")
-        return self.items[-1]
+        return self.items[self._n - 1]
         
     def is_empty(self) -> bool:
         """
@@ -86,7 +235,7 @@ class Stack:
         Returns:
             True if the stack is empty, False otherwise
         """
-        return len(self.items) == 0
+        return self._n == 0
 
 
 class TestStack(unittest.TestCase):
@@ -146,6 +295,73 @@ class TestStack(unittest.TestCase):
             self.assertEqual(self.stack.pop(), i)
             
         self.assertTrue(self.stack.is_empty())
+        
+    def test_track_membership(self):
+        stack = Stack(track_membership=True)
+        stack.push(1)
+        stack.push(2)
+        stack.push(1)
+        self.assertTrue(1 in stack)
+        self.assertFalse(3 in stack)
+        
+        stack.pop()
+        self.assertTrue(1 in stack)
+        stack.pop()
+        stack.pop()
+        self.assertFalse(1 in stack)
+        self.assertFalse(2 in stack)
+        
+        # Unhashable values are not counted but are still found by scanning
+        stack.push([1])
+        stack.push(2)
+        self.assertTrue([1] in stack)
+        self.assertTrue(2 in stack)
+        self.assertFalse([2] in stack)
+        self.assertFalse(1 in stack)
+        self.assertEqual(stack.pop(), 2)
+        self.assertEqual(stack.pop(), [1])
+        self.assertFalse([1] in stack)
+        self.assertEqual(stack._unhashable, 0)
+        self.assertEqual(len(stack._membership), 0)
+
+
+class TestIntStack(unittest.TestCase):
+    def setUp(self):
+        self.stack = IntStack(capacity=2)
+        
+    def test_lifo_order(self):
+        values = [5, -3, 2**40, 0, -2**40, 7]
+        for v in values:
+            self.stack.push(v)
+            
+        self.assertEqual(len(self.stack), len(values))
+        self.assertEqual(self.stack.peek(), 7)
+        self.assertEqual(str(self.stack), str(values))
+        self.assertEqual([self.stack.pop() for _ in values], values[::-1])
+        self.assertTrue(self.stack.is_empty())
+        
+        with self.assertRaises(IndexError):
+            self.stack.pop()
+        with self.assertRaises(IndexError):
+            self.stack.peek()
+            
+    def test_standalone(self):
+        self.assertNotIsInstance(self.stack, Stack)
+        with self.assertRaises(TypeError):
+            IntStack(track_membership=True)
+            
+    def test_contains(self):
+        self.stack.push(1)
+        self.stack.push(3)
+        self.assertTrue(3 in self.stack)
+        self.stack.pop()
+        self.assertFalse(3 in self.stack)
+        
+    def test_rejects_non_integers(self):
+        with self.assertRaises(TypeError):
+            self.stack.push(1.5)
+        with self.assertRaises(ValueError):
+            self.stack.push(2**63)
 
 if __name__ == '__main__':
     unittest.main()
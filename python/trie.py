@@ -1,21 +1,38 @@
+import random
 import unittest
-from typing import Any, Dict, List, Optional
+from bisect import bisect_left
+from collections import deque
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
 
 class TrieNode:
     """
     A node in a Trie (Prefix Tree).
     
+    A node does not store its own character; the key it belongs to is
+    defined by the edge labels on the path from the root.
+    
     Attributes:
-        value: The character stored in this node
         children: Dictionary mapping characters to child nodes
         is_end: Whether this node represents the end of a word
-        count: Number of words that end at this node
     """
-    def __init__(self, value: str = ""):
-        self.value = value
+    __slots__ = ("children", "is_end")
+    
+    def __init__(self):
         self.children: Dict[str, TrieNode] = {}
         self.is_end = False
-        self.count = 0
+
+def _common_prefix_length(a: str, b: str) -> int:
+    """
+    Return the length of the longest common prefix of two strings.
+    """
+    n = min(len(a), len(b))
+    i = 0
+    while i < n and a[i] == b[i]:
+        i += 1
+    return i
+
+# Upper bound on pruned nodes kept around for reuse by later inserts
+_FREE_LIST_MAX = 4096
 
 class Trie:
     """
@@ -29,6 +46,7 @@ class Trie:
         - delete(word) remove a word from the trie
         - get_all_words() return all words in the trie
         - count_words() return the total number of words
+        - freeze() build a read-optimized view used until the next change
     """
     def __init__(self):
         """
@@ -36,6 +54,9 @@ class Trie:
         """
         self.root = TrieNode()
         self._word_count = 0
+        self._free: deque = deque(maxlen=_FREE_LIST_MAX)
+        # (word set, sorted words) built by freeze, dropped on every change
+        self._frozen: Optional[Tuple[FrozenSet[str], List[str]]] = None
         
     def __str__(self) -> str:
         """
@@ -67,14 +88,51 @@ class Trie:
             
         current = self.root
         for char in word:
-            if char not in current.children:
-                current.children[char] = TrieNode(char)
-            current = current.children[char]
+            child = current.children.get(char)
+            if child is None:
+                child = current.children[char] = self._free.pop() if self._free else TrieNode()
+            current = child
             
         if not current.is_end:
             current.is_end = True
-            current.count += 1
             self._word_count += 1
+            self._frozen = None
+            
+    def insert_many(self, words: Iterable[str]) -> None:
+        """
+        Insert several words at once.
+        
+        The words are sorted first so that each one only descends from where
+        it stops sharing a prefix with the previous word, instead of from
+        the root.
+        
+        Args:
+            words: the words to insert
+        """
+        free = self._free
+        path = [self.root]
+        previous = ""
+        added = 0
+        for word in sorted(words):
+            if not word:
+                continue
+            common = _common_prefix_length(previous, word)
+            del path[common + 1:]
+            current = path[-1]
+            for char in word[common:]:
+                child = current.children.get(char)
+                if child is None:
+                    child = current.children[char] = free.pop() if free else TrieNode()
+                current = child
+                path.append(current)
+            if not current.is_end:
+                current.is_end = True
+                added += 1
+            previous = word
+            
+        if added:
+            self._word_count += added
+            self._frozen = None
             
     def search(self, word: str) -> bool:
         """
@@ -89,6 +147,9 @@ class Trie:
         if not word:
             return False
             
+        if self._frozen is not None:
+            return word in self._frozen[0]
+            
         current = self.root
         for char in word:
             if char not in current.children:
@@ -110,6 +171,12 @@ class Trie:
         if not prefix:
             return True
             
+        if self._frozen is not None:
+            # The first word not sorting before the prefix is the only candidate
+            ordered = self._frozen[1]
+            i = bisect_left(ordered, prefix)
+            return i < len(ordered) and ordered[i].startswith(prefix)
+            
         current = self.root
         for char in prefix:
             if char not in current.children:
@@ -118,6 +185,49 @@ class Trie:
             
         return True
         
+    def starts_with_many(self, prefixes: Iterable[str]) -> List[bool]:
+        """
+        Check several prefixes at once.
+        
+        The prefixes are visited in sorted order, so a prefix that extends the
+        one before it (as consecutive autocomplete keystrokes do) resumes
+        from the node the previous walk ended on instead of from the root.
+        
+        Args:
+            prefixes: the prefixes to check
+            
+        Returns:
+            For each prefix, in input order, whether any word starts with it
+        """
+        prefixes = list(prefixes)
+        if self._frozen is not None:
+            return [self.starts_with(prefix) for prefix in prefixes]
+            
+        results = [False] * len(prefixes)
+        # The last prefix walked and the node it reached (None if it failed)
+        previous = ""
+        node = self.root
+        for index in sorted(range(len(prefixes)), key=prefixes.__getitem__):
+            prefix = prefixes[index]
+            if prefix.startswith(previous):
+                if node is None:
+                    # Extends a prefix that is already missing
+                    continue
+                current = node
+                rest = prefix[len(previous):]
+            else:
+                current = self.root
+                rest = prefix
+            for char in rest:
+                current = current.children.get(char)
+                if current is None:
+                    break
+            else:
+                results[index] = True
+            previous = prefix
+            node = current
+        return results
+        
     def delete(self, word: str) -> bool:
         """
         Delete a word from the trie.
@@ -131,30 +241,29 @@ class Trie:
         if not word:
             return False
             
-        def _delete_recursive(node: TrieNode, word: str, depth: int) -> bool:
-            if depth == len(word):
-                if node.is_end:
-                    node.is_end = False
-                    node.count -= 1
-                    return True
-                return False
-                
-            char = word[depth]
-            if char not in node.children:
+        # Record the nodes along the word, then prune emptied nodes bottom-up
+        path = [self.root]
+        for char in word:
+            child = path[-1].children.get(char)
+            if child is None:
                 return False
-                
-            should_delete = _delete_recursive(node.children[char], word, depth + 1)
+            path.append(child)
             
-            if should_delete and not node.children[char].children and not node.children[char].is_end:
-                del node.children[char]
-                
-            return should_delete
+        node = path[-1]
+        if not node.is_end:
+            return False
+        node.is_end = False
+        for depth in range(len(word), 0, -1):
+            node = path[depth]
+            if node.children or node.is_end:
+                break
+            del path[depth - 1].children[word[depth - 1]]
+            # A pruned node is already blank, so it can be reused as is
+            self._free.append(node)
             
-        if self.search(word):
-            _delete_recursive(self.root, word, 0)
-            self._word_count -= 1
-            return True
-        return False
+        self._word_count -= 1
+        self._frozen = None
+        return True
         
     def get_all_words(self) -> List[str]:
         """
@@ -163,16 +272,16 @@ class Trie:
         Returns:
             List of all words in the trie
         """
+        if self._frozen is not None:
+            return list(self._frozen[1])
+            
         words = []
-        
-        def _collect_words(node: TrieNode, current_word: str) -> None:
+        stack = [(self.root, "")]
+        while stack:
+            node, current_word = stack.pop()
             if node.is_end:
                 words.append(current_word)
-                
-            for char, child in node.children.items():
-                _collect_words(child, current_word + char)
-                
-        _collect_words(self.root, "")
+            stack.extend((child, current_word + char) for char, child in node.children.items())
         return words
         
     def count_words(self) -> int:
@@ -184,12 +293,690 @@ class Trie:
         """
         return self._word_count
         
+    def freeze(self) -> None:
+        """
+        Build a read-optimized view of the current words.
+        
+        Until the next insert, delete or clear, search becomes a single set
+        lookup and starts_with a single binary search over the sorted words,
+        instead of one dictionary lookup per character. The node structure is
+        kept as the write buffer, so the trie stays fully mutable.
+        """
+        words = sorted(self.get_all_words())
+        self._frozen = (frozenset(words), words)
+        
+    def to_dafsa(self) -> "DAFSA":
+        """
+        Build an immutable DAFSA holding the current words.
+        
+        Returns:
+            A DAFSA in which identical suffix subtrees are shared
+        """
+        return DAFSA(self.get_all_words())
+        
     def clear(self) -> None:
         """
         Remove all words from the trie.
         """
         self.root = TrieNode()
         self._word_count = 0
+        self._frozen = None
+
+class RadixTrie(Trie):
+    """
+    A Trie with path compression (a radix tree / PATRICIA trie).
+    
+    Chains of single-child nodes are collapsed into one edge labelled with a
+    substring, so a long unique suffix costs one node instead of one per
+    character. Each children dictionary maps the first character of an edge
+    to an (edge label, child) pair, and a lookup moves one whole edge per step
+    using str.startswith.
+    """
+    def __str__(self) -> str:
+        """
+        Return the string representation of the trie.
+        """
+        return f"RadixTrie(words={self._word_count})"
+        
+    def _new_leaf(self, is_end: bool) -> TrieNode:
+        """
+        Create a childless node, reusing a discarded one when available.
+        
+        Args:
+            is_end: whether the node ends a word
+            
+        Returns:
+            The new node
+        """
+        node = self._free.pop() if self._free else TrieNode()
+        node.is_end = is_end
+        return node
+        
+    def insert(self, word: str) -> None:
+        """
+        Insert a word into the trie, splitting an edge if the word diverges
+        partway along it.
+        
+        Args:
+            word: the word to insert
+        """
+        if not word:
+            return
+            
+        node = self.root
+        i = 0
+        n = len(word)
+        while True:
+            entry = node.children.get(word[i])
+            if entry is None:
+                node.children[word[i]] = (word[i:], self._new_leaf(True))
+                break
+                
+            label, child = entry
+            if word.startswith(label, i):
+                i += len(label)
+                node = child
+                if i == n:
+                    if node.is_end:
+                        return
+                    node.is_end = True
+                    break
+                continue
+                
+            # Split the edge after the longest common prefix
+            k = 1
+            m = min(len(label), n - i)
+            while k < m and label[k] == word[i + k]:
+                k += 1
+            middle = self._new_leaf(i + k == n)
+            middle.children[label[k]] = (label[k:], child)
+            node.children[word[i]] = (label[:k], middle)
+            if i + k < n:
+                middle.children[word[i + k]] = (word[i + k:], self._new_leaf(True))
+            break
+            
+        self._word_count += 1
+        self._frozen = None
+        
+    def insert_many(self, words: Iterable[str]) -> None:
+        """
+        Insert several words at once.
+        
+        Args:
+            words: the words to insert
+        """
+        for word in words:
+            self.insert(word)
+            
+    def search(self, word: str) -> bool:
+        """
+        Check if a word exists in the trie.
+        
+        Args:
+            word: the word to search for
+            
+        Returns:
+            True if the word exists, False otherwise
+        """
+        if not word:
+            return False
+            
+        if self._frozen is not None:
+            return word in self._frozen[0]
+            
+        node = self.root
+        i = 0
+        n = len(word)
+        while i < n:
+            entry = node.children.get(word[i])
+            if entry is None:
+                return False
+            label, node = entry
+            step = len(label)
+            # The first character already matched via the dictionary key
+            if step > 1 and not word.startswith(label, i):
+                return False
+            i += step
+            
+        return node.is_end
+        
+    def starts_with(self, prefix: str) -> bool:
+        """
+        Check if any word in the trie starts with the given prefix.
+        
+        Args:
+            prefix: the prefix to search for
+            
+        Returns:
+            True if any word starts with the prefix, False otherwise
+        """
+        if not prefix:
+            return True
+            
+        if self._frozen is not None:
+            ordered = self._frozen[1]
+            i = bisect_left(ordered, prefix)
+            return i < len(ordered) and ordered[i].startswith(prefix)
+            
+        node = self.root
+        i = 0
+        n = len(prefix)
+        while i < n:
+            entry = node.children.get(prefix[i])
+            if entry is None:
+                return False
+            label, node = entry
+            step = len(label)
+            # The first character already matched; a longer label may only
+            # be partly covered by the prefix
+            if step > 1 and not prefix.startswith(label, i):
+                return label.startswith(prefix[i:])
+            i += step
+            
+        return True
+        
+    def starts_with_many(self, prefixes: Iterable[str]) -> List[bool]:
+        """
+        Check several prefixes at once.
+        
+        Args:
+            prefixes: the prefixes to check
+            
+        Returns:
+            For each prefix, in input order, whether any word starts with it
+        """
+        return [self.starts_with(prefix) for prefix in prefixes]
+        
+    def delete(self, word: str) -> bool:
+        """
+        Delete a word from the trie, merging edges that are left with a
+        single child.
+        
+        Args:
+            word: the word to delete
+            
+        Returns:
+            True if the word was deleted, False if it didn't exist
+        """
+        if not word:
+            return False
+            
+        # Each step records (parent, edge key) so the edges can be rewritten
+        path = []
+        node = self.root
+        i = 0
+        n = len(word)
+        while i < n:
+            entry = node.children.get(word[i])
+            if entry is None:
+                return False
+            label, child = entry
+            if not word.startswith(label, i):
+                return False
+            path.append((node, word[i]))
+            node = child
+            i += len(label)
+            
+        if not node.is_end:
+            return False
+        node.is_end = False
+        
+        parent, key = path[-1]
+        if not node.children:
+            del parent.children[key]
+            self._free.append(node)
+            # The parent may now be a pass-through node that can be merged
+            if len(path) > 1 and not parent.is_end and len(parent.children) == 1:
+                grandparent, parent_key = path[-2]
+                self._merge(grandparent, parent_key)
+        elif len(node.children) == 1:
+            self._merge(parent, key)
+            
+        self._word_count -= 1
+        self._frozen = None
+        return True
+        
+    def _merge(self, parent: TrieNode, key: str) -> None:
+        """
+        Collapse the edge parent[key] into the only edge below it.
+        
+        Args:
+            parent: the node owning the edge
+            key: the first character of the edge
+        """
+        label, node = parent.children[key]
+        (child_label, child), = node.children.values()
+        parent.children[key] = (label + child_label, child)
+        node.children.clear()
+        self._free.append(node)
+        
+    def get_all_words(self) -> List[str]:
+        """
+        Get all words stored in the trie.
+        
+        Returns:
+            List of all words in the trie
+        """
+        if self._frozen is not None:
+            return list(self._frozen[1])
+            
+        words = []
+        stack = [(self.root, "")]
+        while stack:
+            node, current_word = stack.pop()
+            if node.is_end:
+                words.append(current_word)
+            stack.extend((child, current_word + label) for label, child in node.children.values())
+        return words
+
+class TSTNode:
+    """
+    A node in a Ternary Search Tree.
+    
+    Attributes:
+        char: The character this node splits on
+        lo: Subtree for characters less than char at the same position
+        eq: Subtree for the next position, after matching char
+        hi: Subtree for characters greater than char at the same position
+        is_end: Whether the path ending at this node is a word
+    """
+    __slots__ = ("char", "lo", "eq", "hi", "is_end")
+    
+    def __init__(self, char: str):
+        self.char = char
+        self.lo: Optional[TSTNode] = None
+        self.eq: Optional[TSTNode] = None
+        self.hi: Optional[TSTNode] = None
+        self.is_end = False
+
+
+class TernarySearchTree(Trie):
+    """
+    A Ternary Search Tree with the Trie interface.
+    
+    Each node holds one character and three links instead of a children
+    dictionary, with siblings arranged as a binary search tree on the
+    character. It has the same number of nodes as the dict-based Trie but
+    each one is several times smaller, at the cost of a few character
+    comparisons per position during lookups.
+    """
+    def __init__(self):
+        """
+        Initialize an empty tree.
+        """
+        super().__init__()
+        self.root: Optional[TSTNode] = None
+        
+    def __str__(self) -> str:
+        """
+        Return the string representation of the tree.
+        """
+        return f"TernarySearchTree(words={self._word_count})"
+        
+    def _find(self, word: str) -> Optional[TSTNode]:
+        """
+        Find the node for the last character of a non-empty word.
+        
+        Args:
+            word: the word or prefix to look up
+            
+        Returns:
+            The node, or None if the path does not exist
+        """
+        node = self.root
+        i = 0
+        last = len(word) - 1
+        while node is not None:
+            char = word[i]
+            node_char = node.char
+            if char < node_char:
+                node = node.lo
+            elif char > node_char:
+                node = node.hi
+            elif i == last:
+                return node
+            else:
+                i += 1
+                node = node.eq
+        return None
+        
+    def insert(self, word: str) -> None:
+        """
+        Insert a word into the tree.
+        
+        Args:
+            word: the word to insert
+        """
+        if not word:
+            return
+            
+        if self.root is None:
+            self.root = TSTNode(word[0])
+        node = self.root
+        i = 0
+        last = len(word) - 1
+        while True:
+            char = word[i]
+            if char < node.char:
+                if node.lo is None:
+                    node.lo = TSTNode(char)
+                node = node.lo
+            elif char > node.char:
+                if node.hi is None:
+                    node.hi = TSTNode(char)
+                node = node.hi
+            elif i == last:
+                break
+            else:
+                i += 1
+                if node.eq is None:
+                    node.eq = TSTNode(word[i])
+                node = node.eq
+                
+        if not node.is_end:
+            node.is_end = True
+            self._word_count += 1
+            self._frozen = None
+            
+    def insert_many(self, words: Iterable[str]) -> None:
+        """
+        Insert several words at once.
+        
+        Args:
+            words: the words to insert
+        """
+        for word in words:
+            self.insert(word)
+            
+    def search(self, word: str) -> bool:
+        """
+        Check if a word exists in the tree.
+        
+        Args:
+            word: the word to search for
+            
+        Returns:
+            True if the word exists, False otherwise
+        """
+        if not word:
+            return False
+            
+        if self._frozen is not None:
+            return word in self._frozen[0]
+            
+        node = self._find(word)
+        return node is not None and node.is_end
+        
+    def starts_with(self, prefix: str) -> bool:
+        """
+        Check if any word in the tree starts with the given prefix.
+        
+        Args:
+            prefix: the prefix to search for
+            
+        Returns:
+            True if any word starts with the prefix, False otherwise
+        """
+        if not prefix:
+            return True
+            
+        if self._frozen is not None:
+            ordered = self._frozen[1]
+            i = bisect_left(ordered, prefix)
+            return i < len(ordered) and ordered[i].startswith(prefix)
+            
+        node = self._find(prefix)
+        # A node kept only to route its lo/hi siblings ends no word
+        return node is not None and (node.is_end or node.eq is not None)
+        
+    def starts_with_many(self, prefixes: Iterable[str]) -> List[bool]:
+        """
+        Check several prefixes at once.
+        
+        Args:
+            prefixes: the prefixes to check
+            
+        Returns:
+            For each prefix, in input order, whether any word starts with it
+        """
+        return [self.starts_with(prefix) for prefix in prefixes]
+        
+    def delete(self, word: str) -> bool:
+        """
+        Delete a word from the tree.
+        
+        Args:
+            word: the word to delete
+            
+        Returns:
+            True if the word was deleted, False if it didn't exist
+        """
+        if not word:
+            return False
+            
+        # Each step records (parent, link name) leading to the next node
+        path = []
+        parent = None
+        link = "root"
+        node = self.root
+        i = 0
+        last = len(word) - 1
+        while node is not None:
+            path.append((parent, link))
+            char = word[i]
+            if char < node.char:
+                link = "lo"
+            elif char > node.char:
+                link = "hi"
+            elif i == last:
+                break
+            else:
+                i += 1
+                link = "eq"
+            parent = node
+            node = getattr(node, link)
+            
+        if node is None or not node.is_end:
+            return False
+        node.is_end = False
+        
+        # Unlink nodes that no longer lead anywhere, bottom-up
+        while path and node.lo is None and node.eq is None and node.hi is None and not node.is_end:
+            parent, link = path.pop()
+            if parent is None:
+                self.root = None
+                break
+            setattr(parent, link, None)
+            node = parent
+            
+        self._word_count -= 1
+        self._frozen = None
+        return True
+        
+    def get_all_words(self) -> List[str]:
+        """
+        Get all words stored in the tree.
+        
+        Returns:
+            List of all words in the tree
+        """
+        if self._frozen is not None:
+            return list(self._frozen[1])
+            
+        words = []
+        stack = [(self.root, "")] if self.root is not None else []
+        while stack:
+            node, prefix = stack.pop()
+            if node.lo is not None:
+                stack.append((node.lo, prefix))
+            if node.hi is not None:
+                stack.append((node.hi, prefix))
+            current_word = prefix + node.char
+            if node.is_end:
+                words.append(current_word)
+            if node.eq is not None:
+                stack.append((node.eq, current_word))
+        return words
+        
+    def clear(self) -> None:
+        """
+        Remove all words from the tree.
+        """
+        super().clear()
+        self.root = None
+
+class DAFSA:
+    """
+    A Directed Acyclic Word Graph (DAFSA / minimal acyclic automaton).
+    
+    A trie in which identical suffix subtrees are stored once, built in a
+    single pass over the sorted words with Daciuk et al.'s incremental
+    minimisation. Dictionaries with shared endings ("-ing", "-ed", "-s")
+    need far fewer nodes than a Trie. The graph is immutable; build a new
+    one to change the word set.
+    
+    Methods:
+        - search(word) check if a word exists
+        - starts_with(prefix) check if any word starts with the given prefix
+        - get_all_words() return all words in sorted order
+        - node_count() return the number of distinct nodes
+    """
+    def __init__(self, words: Iterable[str] = ()):
+        """
+        Build the graph from a collection of words.
+        
+        Args:
+            words: the words to store; duplicates and empty strings are ignored
+        """
+        self.root = TrieNode()
+        self._word_count = 0
+        
+        # Canonical nodes keyed by (is_end, outgoing edges)
+        register: Dict[Tuple[bool, Tuple[Tuple[str, int], ...]], TrieNode] = {}
+        # (parent, char, child) edges along the previous word not yet minimised
+        unchecked: List[Tuple[TrieNode, str, TrieNode]] = []
+        
+        def minimise(down_to: int) -> None:
+            while len(unchecked) > down_to:
+                parent, char, child = unchecked.pop()
+                # Children are already canonical, so identity describes them
+                key = (child.is_end, tuple((c, id(n)) for c, n in child.children.items()))
+                existing = register.get(key)
+                if existing is None:
+                    register[key] = child
+                else:
+                    parent.children[char] = existing
+                    
+        previous = ""
+        for word in sorted(set(words)):
+            if not word:
+                continue
+            common = _common_prefix_length(previous, word)
+            minimise(common)
+            node = unchecked[-1][2] if unchecked else self.root
+            for char in word[common:]:
+                child = TrieNode()
+                node.children[char] = child
+                unchecked.append((node, char, child))
+                node = child
+            node.is_end = True
+            self._word_count += 1
+            previous = word
+        minimise(0)
+        
+    def __str__(self) -> str:
+        """
+        Return the string representation of the graph.
+        """
+        return f"DAFSA(words={self._word_count})"
+        
+    def __repr__(self) -> str:
+        """
+        Return the string representation of the graph.
+        """
+        return self.__str__()
+        
+    def __len__(self) -> int:
+        """
+        Return the number of words in the graph.
+        """
+        return self._word_count
+        
+    def _find(self, word: str) -> Optional[TrieNode]:
+        """
+        Follow a word from the root.
+        
+        Args:
+            word: the word or prefix to follow
+            
+        Returns:
+            The node reached, or None if the path does not exist
+        """
+        current = self.root
+        for char in word:
+            if char not in current.children:
+                return None
+            current = current.children[char]
+        return current
+        
+    def search(self, word: str) -> bool:
+        """
+        Check if a word exists in the graph.
+        
+        Args:
+            word: the word to search for
+            
+        Returns:
+            True if the word exists, False otherwise
+        """
+        if not word:
+            return False
+        node = self._find(word)
+        return node is not None and node.is_end
+        
+    def starts_with(self, prefix: str) -> bool:
+        """
+        Check if any word in the graph starts with the given prefix.
+        
+        Args:
+            prefix: the prefix to search for
+            
+        Returns:
+            True if any word starts with the prefix, False otherwise
+        """
+        if not prefix:
+            return True
+        return self._find(prefix) is not None
+        
+    def get_all_words(self) -> List[str]:
+        """
+        Get all words stored in the graph.
+        
+        Returns:
+            List of all words in sorted order
+        """
+        words = []
+        # Children were added in sorted order, so push them in reverse
+        stack = [(self.root, "")]
+        while stack:
+            node, current_word = stack.pop()
+            if node.is_end:
+                words.append(current_word)
+            stack.extend((child, current_word + char) for char, child in reversed(node.children.items()))
+        return words
+        
+    def node_count(self) -> int:
+        """
+        Return the number of distinct nodes, counting shared nodes once.
+        """
+        seen = {id(self.root)}
+        stack = [self.root]
+        while stack:
+            for child in stack.pop().children.values():
+                if id(child) not in seen:
+                    seen.add(id(child))
+                    stack.append(child)
+        return len(seen)
 
 
 class TestTrie(unittest.TestCase):
@@ -282,6 +1069,85 @@ class TestTrie(unittest.TestCase):
         self.assertTrue(self.trie.starts_with("help"))
         self.assertFalse(self.trie.starts_with("heo"))
         
+    def test_insert_many(self):
+        words = ["car", "cart", "carbon", "ca", "dog", "car", "", "do", "cab"]
+        self.trie.insert("cab")
+        self.trie.insert_many(iter(words))
+        self.assertEqual(len(self.trie), 7)
+        self.assertEqual(sorted(self.trie.get_all_words()), ["ca", "cab", "car", "carbon", "cart", "do", "dog"])
+        self.assertTrue(self.trie.search("carbon"))
+        self.assertFalse(self.trie.search("carb"))
+        self.assertTrue(self.trie.starts_with("carb"))
+        self.trie.freeze()
+        self.trie.insert_many(["zebra"])
+        self.assertTrue(self.trie.search("zebra"))
+        
+    def test_starts_with_many(self):
+        for word in ["apple", "app", "banana", "band"]:
+            self.trie.insert(word)
+        prefixes = ["ban", "apple", "apples", "", "b", "band", "bane", "c", "ap", "bandana"]
+        expected = [self.trie.starts_with(prefix) for prefix in prefixes]
+        self.assertEqual(expected, [True, True, False, True, True, True, False, False, True, False])
+        self.assertEqual(self.trie.starts_with_many(iter(prefixes)), expected)
+        self.trie.freeze()
+        self.assertEqual(self.trie.starts_with_many(prefixes), expected)
+        self.assertEqual(self.trie.starts_with_many([]), [])
+        
+    def test_freeze(self):
+        words = ["cat", "cats", "catch", "dog", "do"]
+        for word in words:
+            self.trie.insert(word)
+        self.trie.freeze()
+        
+        self.assertTrue(self.trie.search("cat"))
+        self.assertFalse(self.trie.search("ca"))
+        self.assertTrue(self.trie.starts_with("catc"))
+        self.assertTrue(self.trie.starts_with("d"))
+        self.assertFalse(self.trie.starts_with("dot"))
+        self.assertFalse(self.trie.starts_with("e"))
+        self.assertEqual(self.trie.get_all_words(), sorted(words))
+        
+        # Changes drop the frozen view and are visible immediately
+        self.trie.insert("dot")
+        self.assertTrue(self.trie.starts_with("dot"))
+        self.trie.freeze()
+        self.assertTrue(self.trie.delete("cat"))
+        self.assertFalse(self.trie.search("cat"))
+        self.assertTrue(self.trie.search("cats"))
+        self.trie.freeze()
+        self.trie.clear()
+        self.assertFalse(self.trie.search("dog"))
+        
+    def test_node_reuse(self):
+        self.trie.insert("cart")
+        self.trie.insert("car")
+        self.assertTrue(self.trie.delete("cart"))
+        self.assertEqual(len(self.trie._free), 1)
+        self.assertTrue(self.trie.delete("car"))
+        self.assertEqual(len(self.trie._free), 4)
+        
+        self.trie.insert("dog")
+        self.assertEqual(len(self.trie._free), 1)
+        self.assertEqual(self.trie.get_all_words(), ["dog"])
+        self.assertFalse(self.trie.search("do"))
+        self.assertFalse(self.trie.starts_with("c"))
+        
+    def test_slots(self):
+        self.trie.insert("a")
+        self.assertFalse(hasattr(self.trie.root, "__dict__"))
+        self.assertFalse(hasattr(self.trie.root.children["a"], "__dict__"))
+        
+    def test_long_word(self):
+        # Deeper than the default recursion limit
+        word = "a" * 5000
+        self.trie.insert(word)
+        self.trie.insert("a" * 10)
+        self.assertEqual(sorted(self.trie.get_all_words(), key=len), ["a" * 10, word])
+        self.assertTrue(self.trie.delete(word))
+        self.assertFalse(self.trie.search(word))
+        self.assertTrue(self.trie.search("a" * 10))
+        self.assertFalse(self.trie.starts_with("a" * 11))
+        
     def test_complex_words(self):
         words = ["cat", "cats", "catch", "catching", "caught"]
         for word in words:
@@ -296,5 +1162,153 @@ class TestTrie(unittest.TestCase):
         self.assertFalse(self.trie.search("catch"))
         self.assertTrue(self.trie.starts_with("cat"))
 
+class TestRadixTrie(TestTrie):
+    """
+    Runs the Trie suite against RadixTrie, plus edge splitting and merging.
+    """
+    def setUp(self):
+        self.trie = RadixTrie()
+        
+    def test_slots(self):
+        self.trie.insert("ab")
+        self.assertFalse(hasattr(self.trie.root, "__dict__"))
+        self.assertFalse(hasattr(self.trie.root.children["a"][1], "__dict__"))
+        
+    def test_node_reuse(self):
+        self.trie.insert("cart")
+        self.trie.insert("car")
+        self.assertTrue(self.trie.delete("cart"))
+        self.assertEqual(len(self.trie._free), 1)
+        self.trie.insert("cab")
+        self.assertEqual(len(self.trie._free), 0)
+        self.assertEqual(sorted(self.trie.get_all_words()), ["cab", "car"])
+        
+    def test_edges(self):
+        self.trie.insert("catching")
+        self.assertEqual(self.trie.root.children["c"][0], "catching")
+        
+        # Diverging and shorter words split the edge
+        self.trie.insert("cat")
+        self.trie.insert("cap")
+        label, node = self.trie.root.children["c"]
+        self.assertEqual(label, "ca")
+        self.assertEqual(node.children["t"][0], "t")
+        self.assertEqual(node.children["t"][1].children["c"][0], "ching")
+        self.assertTrue(self.trie.starts_with("catch"))
+        self.assertFalse(self.trie.starts_with("catz"))
+        self.assertFalse(self.trie.search("catch"))
+        
+        # Deleting merges pass-through nodes back into one edge
+        self.assertTrue(self.trie.delete("cat"))
+        self.assertEqual(node.children["t"][0], "tching")
+        self.assertTrue(self.trie.delete("cap"))
+        self.assertEqual(self.trie.root.children["c"][0], "catching")
+        self.assertEqual(self.trie.get_all_words(), ["catching"])
+        
+    def test_matches_trie(self):
+        rng = random.Random(7)
+        reference = Trie()
+        words = ["".join(rng.choice("abc") for _ in range(rng.randint(1, 6))) for _ in range(300)]
+        for word in words:
+            self.trie.insert(word)
+            reference.insert(word)
+        for word in words[::2]:
+            self.assertEqual(self.trie.delete(word), reference.delete(word))
+        self.assertEqual(sorted(self.trie.get_all_words()), sorted(reference.get_all_words()))
+        self.assertEqual(len(self.trie), len(reference))
+        for word in words:
+            for end in range(len(word) + 1):
+                self.assertEqual(self.trie.search(word[:end]), reference.search(word[:end]))
+                self.assertEqual(self.trie.starts_with(word[:end]), reference.starts_with(word[:end]))
+
+
+class TestTernarySearchTree(TestTrie):
+    """
+    Runs the Trie suite against TernarySearchTree.
+    """
+    def setUp(self):
+        self.trie = TernarySearchTree()
+        
+    def test_init(self):
+        self.assertEqual(len(self.trie), 0)
+        self.assertIsNone(self.trie.root)
+        
+    def test_slots(self):
+        self.trie.insert("ab")
+        self.assertFalse(hasattr(self.trie.root, "__dict__"))
+        self.assertFalse(hasattr(self.trie.root.eq, "__dict__"))
+        
+    def test_node_reuse(self):
+        # No free list; check that deletes unlink dead nodes instead
+        self.trie.insert("cat")
+        self.trie.insert("car")
+        self.trie.insert("b")
+        self.assertTrue(self.trie.delete("cat"))
+        self.assertFalse(self.trie.starts_with("cat"))
+        self.assertTrue(self.trie.search("car"))
+        self.assertTrue(self.trie.delete("car"))
+        self.assertIsNone(self.trie.root.eq)
+        
+        # "c" stays as the parent of "b" but no longer starts a word
+        self.assertFalse(self.trie.starts_with("c"))
+        self.assertTrue(self.trie.starts_with("b"))
+        self.assertTrue(self.trie.delete("b"))
+        self.assertFalse(self.trie.starts_with("c"))
+        self.assertEqual(self.trie.get_all_words(), [])
+        
+    def test_matches_trie(self):
+        TestRadixTrie.test_matches_trie(self)
+
+
+class TestDAFSA(unittest.TestCase):
+    def setUp(self):
+        self.words = ["tap", "taps", "top", "tops", "stop", "stops", "tap", ""]
+        self.dafsa = DAFSA(self.words)
+        
+    def test_init(self):
+        self.assertEqual(len(self.dafsa), 6)
+        self.assertEqual(len(DAFSA()), 0)
+        self.assertEqual(DAFSA().get_all_words(), [])
+        self.assertEqual(str(self.dafsa), "DAFSA(words=6)")
+        
+    def test_search(self):
+        for word in ["tap", "taps", "top", "tops", "stop", "stops"]:
+            self.assertTrue(self.dafsa.search(word))
+        for word in ["", "ta", "to", "sto", "stap", "tapss", "x"]:
+            self.assertFalse(self.dafsa.search(word))
+            
+    def test_starts_with(self):
+        self.assertTrue(self.dafsa.starts_with(""))
+        self.assertTrue(self.dafsa.starts_with("st"))
+        self.assertTrue(self.dafsa.starts_with("taps"))
+        self.assertFalse(self.dafsa.starts_with("sta"))
+        self.assertFalse(self.dafsa.starts_with("tapss"))
+        
+    def test_get_all_words(self):
+        self.assertEqual(self.dafsa.get_all_words(), ["stop", "stops", "tap", "taps", "top", "tops"])
+        
+    def test_shared_suffixes(self):
+        # A trie needs 13 nodes; the "p" -> "s" tails after "ta", "to" and "sto" are shared
+        self.assertEqual(self.dafsa.node_count(), 7)
+        t = self.dafsa.root.children["t"]
+        self.assertIs(t.children["a"], t.children["o"])
+        self.assertIs(t.children["o"], self.dafsa.root.children["s"].children["t"].children["o"])
+        
+    def test_matches_trie(self):
+        rng = random.Random(3)
+        trie = Trie()
+        words = ["".join(rng.choice("abc") for _ in range(rng.randint(1, 7))) for _ in range(500)]
+        for word in words:
+            trie.insert(word)
+        dafsa = trie.to_dafsa()
+        self.assertEqual(dafsa.get_all_words(), sorted(trie.get_all_words()))
+        self.assertLess(dafsa.node_count(), 1 + sum(len(word) for word in set(words)))
+        for word in words:
+            for end in range(len(word) + 2):
+                probe = word[:end] if end <= len(word) else word + "c"
+                self.assertEqual(dafsa.search(probe), trie.search(probe))
+                self.assertEqual(dafsa.starts_with(probe), trie.starts_with(probe))
+
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file